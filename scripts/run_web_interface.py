@@ -6,13 +6,21 @@ from __future__ import annotations
 import argparse
 import base64
 import contextlib
+import functools
+import hashlib
 import io
 import json
+import multiprocessing
+import os
+import queue
 import sys
 import threading
 import time
 import urllib.parse
+import uuid
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -24,11 +32,27 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from star_chart_generator import QualityPreset, SceneConfig, generate_star_chart  # noqa: E402
+from star_chart_generator import QualityPreset, SceneConfig  # noqa: E402
 
 
 DEFAULT_CONFIG_DIR = PROJECT_ROOT / "configs"
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "output"
+# zlib level for PNGs that only travel to the browser; saved files keep the default.
+PREVIEW_COMPRESS_LEVEL = 1
+# Rendered PNGs are kept in memory until the browser fetches them from
+# ``/api/render/<id>.png``; old entries expire or are evicted past the cap.
+RENDER_TTL_SECONDS = 600.0
+RENDER_CACHE_LIMIT = 8
+# Renders waiting for or running on the worker pool, per worker, before new
+# requests are answered with 503.
+RENDER_QUEUE_PER_WORKER = 2
+# Renders a worker process runs before it is replaced. Workers keep the
+# package's per-process caches (parsed configs, ring outlines, glyphs, blur
+# kernels) warm between jobs; recycling now and then returns the memory of
+# large renders to the OS. 0 keeps workers for the life of the server.
+RENDERS_PER_WORKER = 16
+# How often a streaming render checks for finished jobs between progress events.
+PROGRESS_POLL_SECONDS = 0.25
 
 
 INDEX_HTML = """<!DOCTYPE html>
@@ -273,6 +297,47 @@ INDEX_HTML = """<!DOCTYPE html>
       }
     }
 
+    const STAGE_LABELS = {
+      scene: 'Preparando la escena...',
+      stars: 'Renderizando estrellas...',
+      overlays: 'Dibujando la interfaz...',
+      post: 'Aplicando posprocesado...',
+      encode: 'Codificando PNG...'
+    };
+
+    async function readRenderEvents(response, status) {
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+          throw new Error('La conexión se cerró antes de terminar el render');
+        }
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\\n\\n')) !== -1) {
+          const frame = buffer.slice(0, boundary);
+          buffer = buffer.slice(boundary + 2);
+          let name = 'message';
+          let payload = '';
+          for (const line of frame.split('\\n')) {
+            if (line.startsWith('event: ')) {
+              name = line.slice(7);
+            } else if (line.startsWith('data: ')) {
+              payload += line.slice(6);
+            }
+          }
+          const data = JSON.parse(payload);
+          if (name === 'progress') {
+            status.textContent = STAGE_LABELS[data.stage] || 'Renderizando...';
+          } else {
+            return data;
+          }
+        }
+      }
+    }
+
     async function renderChart(event) {
       event.preventDefault();
       const button = document.getElementById('render-button');
@@ -297,14 +362,15 @@ INDEX_HTML = """<!DOCTYPE html>
       try {
         const response = await fetch('/api/render', {
           method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
+          headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
           body: JSON.stringify({ config, seed, save, quality })
         });
-        const data = await response.json();
+        const isStream = (response.headers.get('Content-Type') || '').startsWith('text/event-stream');
+        const data = isStream ? await readRenderEvents(response, status) : await response.json();
         if (!response.ok || data.status !== 'ok') {
           throw new Error(data.message || 'El render falló');
         }
-        image.src = data.image_data_url;
+        image.src = data.image_url;
         const seconds = Number(data.elapsed_seconds || 0).toFixed(2);
         const saved = data.saved_image ? ` • Guardado en ${data.saved_image}` : '';
         const qualityUsed = (data.quality || quality || 'final');
@@ -363,14 +429,38 @@ INDEX_HTML = """<!DOCTYPE html>
 """
 
 
-def _list_configs(config_dir: Path) -> List[str]:
-    patterns = ("*.yaml", "*.yml")
-    items: List[str] = []
-    for pattern in patterns:
-        for path in sorted(config_dir.rglob(pattern)):
-            if path.is_file():
-                items.append(path.relative_to(config_dir).as_posix())
-    return items
+INDEX_BYTES = INDEX_HTML.encode("utf-8")
+INDEX_ETAG = f'"index-{hashlib.sha1(INDEX_BYTES).hexdigest()}"'
+
+
+def _directory_stamp(directories: Tuple[Path, ...]) -> Tuple[int, ...]:
+    """Return the modification times of ``directories`` (``-1`` if missing)."""
+
+    stamp = []
+    for directory in directories:
+        try:
+            stamp.append(directory.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(-1)
+    return tuple(stamp)
+
+
+def _scan_configs(config_dir: Path) -> Tuple[List[str], Tuple[Path, ...]]:
+    """List YAML configs below ``config_dir`` and the directories that were walked."""
+
+    by_suffix: Dict[str, List[Path]] = {".yaml": [], ".yml": []}
+    directories = [config_dir]
+    for path in config_dir.rglob("*"):
+        if path.is_dir():
+            directories.append(path)
+        elif path.suffix in by_suffix and path.is_file():
+            by_suffix[path.suffix].append(path)
+    items = [
+        path.relative_to(config_dir).as_posix()
+        for paths in by_suffix.values()
+        for path in sorted(paths)
+    ]
+    return items, tuple(directories)
 
 
 def _normalize_seed(seed: Optional[Any]) -> Optional[int]:
@@ -392,6 +482,82 @@ def _ensure_within(path: Path, directory: Path) -> Path:
     return resolved
 
 
+class ServerBusyError(RuntimeError):
+    """Raised when the render pool already has too many queued jobs."""
+
+
+def _render_job(
+    config_path: str,
+    quality: Optional[str],
+    seed: Optional[int],
+    compress_level: int,
+    progress_queue: Optional[Any] = None,
+) -> Tuple[bytes, float, str]:
+    """Render a scene inside a pool worker and return ``(png, seconds, quality)``.
+
+    When ``progress_queue`` is given, stage names are put on it as they start.
+    """
+
+    from star_chart_generator import generate_star_chart
+
+    config = SceneConfig.load(Path(config_path))
+    applied_quality = QualityPreset.FINAL.value
+    if quality:
+        preset = QualityPreset.from_value(quality)
+        applied_quality = preset.value
+        config = config.with_quality(preset)
+
+    progress = progress_queue.put if progress_queue is not None else None
+    start = time.perf_counter()
+    result = generate_star_chart(config, seed=seed, progress=progress)
+    if progress is not None:
+        progress("encode")
+    png_bytes = result.png_bytes(compress_level)
+    elapsed = time.perf_counter() - start
+    return png_bytes, elapsed, applied_quality
+
+
+def _splice_json_field(document: bytes, key: str, *value_parts: bytes) -> bytes:
+    """Append ``key`` to a serialized JSON object without re-escaping its value.
+
+    The value is the concatenation of ``value_parts``, which must already be
+    valid inside a JSON string (base64 text is). The parts are joined straight
+    into the result so a large value is copied only once.
+    """
+
+    return b"".join(
+        (document[:-1], b", ", json.dumps(key).encode("ascii"), b': "', *value_parts, b'"}')
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``.
+
+    The header is a comma-separated list of entity tags or ``*``. Entries are
+    compared whole, with any weak ``W/`` prefix ignored, as the weak comparison
+    that ``If-None-Match`` calls for.
+    """
+
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_debug_command(source: str, mode: str) -> Any:
+    """Compile console input once; re-running the same snippet reuses the code object."""
+
+    return compile(source, "<debug-console>", mode)
+
+
 def _execute_debug_command(command: str, namespace: Dict[str, Any]) -> Tuple[str, str]:
     command = command.replace("\r\n", "\n")
     stripped = command.strip()
@@ -403,9 +569,9 @@ def _execute_debug_command(command: str, namespace: Dict[str, Any]) -> Tuple[str
 
     try:
         try:
-            compiled = compile(stripped, "<debug-console>", "eval")
+            compiled = _compile_debug_command(stripped, "eval")
         except SyntaxError:
-            compiled = compile(command, "<debug-console>", "exec")
+            compiled = _compile_debug_command(command, "exec")
             with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(stderr_buffer):
                 exec(compiled, namespace, namespace)
         else:
@@ -432,6 +598,8 @@ class InterfaceHTTPServer(ThreadingHTTPServer):
         project_root: Path,
         config_dir: Path,
         output_dir: Path,
+        render_workers: Optional[int] = None,
+        renders_per_worker: int = RENDERS_PER_WORKER,
     ) -> None:
         super().__init__(address, handler)
         self.project_root = project_root
@@ -444,8 +612,104 @@ class InterfaceHTTPServer(ThreadingHTTPServer):
             "OUTPUT_DIR": output_dir,
             "SceneConfig": SceneConfig,
             "QualityPreset": QualityPreset,
-            "generate_star_chart": generate_star_chart,
         }
+        self._renders: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._renders_lock = threading.Lock()
+
+        # Rendering is CPU-bound pure Python, so jobs run in separate processes
+        # instead of competing for the GIL on the request threads.
+        workers = max(1, render_workers or os.cpu_count() or 1)
+        pool_options: Dict[str, Any] = {
+            "max_workers": workers,
+            "mp_context": multiprocessing.get_context("spawn"),
+        }
+        if renders_per_worker > 0 and sys.version_info >= (3, 11):
+            # Recycling every job would start a fresh interpreter per render and
+            # throw away every cache; every N jobs still bounds memory growth.
+            pool_options["max_tasks_per_child"] = renders_per_worker
+        self.render_pool = ProcessPoolExecutor(**pool_options)
+        self._render_queue_limit = workers * RENDER_QUEUE_PER_WORKER
+        self._pending_renders = 0
+        self._pending_lock = threading.Lock()
+        # Started on the first streaming render; its queues can be handed to
+        # pool workers, which plain multiprocessing queues cannot.
+        self._progress_manager: Optional[Any] = None
+        # Adding, removing or renaming a config touches its parent directory, so
+        # the listing is rescanned only when a walked directory's mtime changes.
+        self._configs_cache: Optional[Tuple[Tuple[Path, ...], Tuple[int, ...], List[str]]] = None
+        self._configs_lock = threading.Lock()
+
+    def list_configs(self) -> List[str]:
+        with self._configs_lock:
+            cached = self._configs_cache
+            if cached is not None:
+                directories, stamp, items = cached
+                if _directory_stamp(directories) == stamp:
+                    return list(items)
+            items, directories = _scan_configs(self.config_dir)
+            self._configs_cache = (directories, _directory_stamp(directories), items)
+            return list(items)
+
+    def progress_queue(self) -> Any:
+        """Return a new queue that render workers can report progress on."""
+
+        with self._pending_lock:
+            if self._progress_manager is None:
+                self._progress_manager = multiprocessing.get_context("spawn").Manager()
+            return self._progress_manager.Queue()
+
+    def submit_render(
+        self,
+        config_path: Path,
+        quality: Optional[str],
+        seed: Optional[int],
+        compress_level: int,
+        progress_queue: Optional[Any] = None,
+    ) -> "Future[Tuple[bytes, float, str]]":
+        with self._pending_lock:
+            if self._pending_renders >= self._render_queue_limit:
+                raise ServerBusyError("Too many renders in progress, try again shortly")
+            self._pending_renders += 1
+        try:
+            future = self.render_pool.submit(
+                _render_job, str(config_path), quality, seed, compress_level, progress_queue
+            )
+        except BaseException:
+            self._render_finished(None)
+            raise
+        future.add_done_callback(self._render_finished)
+        return future
+
+    def _render_finished(self, _future: Optional[Future]) -> None:
+        with self._pending_lock:
+            self._pending_renders -= 1
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.render_pool.shutdown(wait=False, cancel_futures=True)
+        if self._progress_manager is not None:
+            self._progress_manager.shutdown()
+
+    def store_render(self, png_bytes: bytes) -> str:
+        """Keep ``png_bytes`` available for download and return its identifier."""
+
+        render_id = uuid.uuid4().hex
+        now = time.monotonic()
+        with self._renders_lock:
+            self._renders[render_id] = (now, png_bytes)
+            while self._renders:
+                oldest_id, (created, _) = next(iter(self._renders.items()))
+                if len(self._renders) <= RENDER_CACHE_LIMIT and now - created <= RENDER_TTL_SECONDS:
+                    break
+                del self._renders[oldest_id]
+        return render_id
+
+    def fetch_render(self, render_id: str) -> Optional[bytes]:
+        with self._renders_lock:
+            entry = self._renders.get(render_id)
+        if entry is None or time.monotonic() - entry[0] > RENDER_TTL_SECONDS:
+            return None
+        return entry[1]
 
 
 class RequestHandler(BaseHTTPRequestHandler):
@@ -454,11 +718,30 @@ class RequestHandler(BaseHTTPRequestHandler):
     def log_message(self, fmt: str, *args: Any) -> None:  # pragma: no cover - cosmetic
         sys.stdout.write("[%s] %s\n" % (self.log_date_time_string(), fmt % args))
 
-    def _send_bytes(self, payload: bytes, *, content_type: str, status: HTTPStatus = HTTPStatus.OK) -> None:
+    def _send_bytes(
+        self,
+        payload: bytes,
+        *,
+        content_type: str,
+        status: HTTPStatus = HTTPStatus.OK,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Send ``payload``; with an ``etag`` the browser may revalidate it for a 304."""
+
+        if etag is not None and _etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
         self.send_response(status)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(payload)))
-        self.send_header("Cache-Control", "no-store")
+        if etag is None:
+            self.send_header("Cache-Control", "no-store")
+        else:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
         self.end_headers()
         self.wfile.write(payload)
 
@@ -467,11 +750,13 @@ class RequestHandler(BaseHTTPRequestHandler):
         self._send_bytes(data, content_type="application/json; charset=utf-8", status=status)
 
     def _handle_index(self) -> None:
-        self._send_bytes(INDEX_HTML.encode("utf-8"), content_type="text/html; charset=utf-8")
+        self._send_bytes(INDEX_BYTES, content_type="text/html; charset=utf-8", etag=INDEX_ETAG)
 
     def _handle_list_configs(self) -> None:
-        configs = _list_configs(self.server.config_dir)
-        self._send_json({"configs": configs})
+        configs = self.server.list_configs()
+        payload = json.dumps({"configs": configs}).encode("utf-8")
+        etag = f'"configs-{hashlib.sha1(payload).hexdigest()}"'
+        self._send_bytes(payload, content_type="application/json; charset=utf-8", etag=etag)
 
     def _parse_json_body(self) -> Dict[str, Any]:
         length_header = self.headers.get("Content-Length")
@@ -482,11 +767,13 @@ class RequestHandler(BaseHTTPRequestHandler):
         if not raw:
             raise ValueError("Empty request body")
         try:
-            return json.loads(raw.decode("utf-8"))
+            # json.loads detects the UTF encoding of bytes itself; no decoded copy.
+            return json.loads(raw)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Invalid JSON payload: {exc}") from exc
 
     def _handle_render(self) -> None:
+        stream = "text/event-stream" in self.headers.get("Accept", "")
         try:
             payload = self._parse_json_body()
             config_name = payload.get("config")
@@ -499,46 +786,22 @@ class RequestHandler(BaseHTTPRequestHandler):
             seed = _normalize_seed(payload.get("seed"))
             save_output = bool(payload.get("save", False))
 
-            config = SceneConfig.load(config_path)
-            quality_name = payload.get("quality")
-            applied_quality = QualityPreset.FINAL.value
-            if quality_name:
-                try:
-                    preset = QualityPreset.from_value(quality_name)
-                except ValueError as exc:
-                    raise ValueError(str(exc)) from exc
-                applied_quality = preset.value
-                config = config.with_quality(preset)
-
-            start = time.perf_counter()
-            result = generate_star_chart(config, seed=seed)
-            elapsed = time.perf_counter() - start
-
-            png_bytes = result.image.to_png_bytes()
-            encoded = base64.b64encode(png_bytes).decode("ascii")
-            image_data_url = f"data:image/png;base64,{encoded}"
-
-            saved_image: Optional[str] = None
-            if save_output:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                output_dir = self.server.output_dir
-                output_dir.mkdir(parents=True, exist_ok=True)
-                filename = f"{config_path.stem}_{timestamp}.png"
-                output_path = output_dir / filename
-                output_path.write_bytes(png_bytes)
-                try:
-                    saved_image = output_path.relative_to(self.server.project_root).as_posix()
-                except ValueError:
-                    saved_image = str(output_path)
-
+            # A saved render reuses the disk encoding for the preview instead of
+            # deflating the same pixels twice.
+            compress_level = 6 if save_output else PREVIEW_COMPRESS_LEVEL
+            progress_queue = self.server.progress_queue() if stream else None
+            future = self.server.submit_render(
+                config_path, payload.get("quality"), seed, compress_level, progress_queue
+            )
+            if stream:
+                self._stream_render(future, progress_queue, config_path, payload)
+                return
+            document = self._render_document(future.result(), config_path, payload)
+            self._send_bytes(document, content_type="application/json; charset=utf-8")
+        except ServerBusyError as exc:
             self._send_json(
-                {
-                    "status": "ok",
-                    "image_data_url": image_data_url,
-                    "elapsed_seconds": elapsed,
-                    "saved_image": saved_image,
-                    "quality": applied_quality,
-                }
+                {"status": "error", "message": str(exc)},
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
             )
         except Exception as exc:  # pragma: no cover - error reporting path
             self._send_json(
@@ -546,11 +809,104 @@ class RequestHandler(BaseHTTPRequestHandler):
                 status=HTTPStatus.BAD_REQUEST,
             )
 
+    def _stream_render(
+        self,
+        future: "Future[Tuple[bytes, float, str]]",
+        progress_queue: Any,
+        config_path: Path,
+        payload: Dict[str, Any],
+    ) -> None:
+        """Answer a render as Server-Sent Events: ``progress`` frames, then ``done``."""
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            while True:
+                done = future.done()
+                try:
+                    while True:
+                        stage = progress_queue.get(timeout=0 if done else PROGRESS_POLL_SECONDS)
+                        self._send_event("progress", json.dumps({"stage": stage}).encode("utf-8"))
+                except queue.Empty:
+                    pass
+                if done:
+                    break
+            try:
+                document = self._render_document(future.result(), config_path, payload)
+            except Exception as exc:  # pragma: no cover - error reporting path
+                error = {"status": "error", "message": str(exc)}
+                self._send_event("error", json.dumps(error).encode("utf-8"))
+            else:
+                self._send_event("done", document)
+        except ConnectionError:  # pragma: no cover - client went away mid-render
+            pass
+
+    def _send_event(self, event: str, data: bytes) -> None:
+        self.wfile.write(b"event: " + event.encode("ascii") + b"\ndata: ")
+        self.wfile.write(data)
+        self.wfile.write(b"\n\n")
+        self.wfile.flush()
+
+    def _render_document(
+        self, outcome: Tuple[bytes, float, str], config_path: Path, payload: Dict[str, Any]
+    ) -> bytes:
+        """Store a finished render and return the JSON document describing it."""
+
+        png_bytes, elapsed, applied_quality = outcome
+        render_id = self.server.store_render(png_bytes)
+
+        saved_image: Optional[str] = None
+        if payload.get("save", False):
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            output_dir = self.server.output_dir
+            output_dir.mkdir(parents=True, exist_ok=True)
+            filename = f"{config_path.stem}_{timestamp}.png"
+            output_path = output_dir / filename
+            output_path.write_bytes(png_bytes)
+            try:
+                saved_image = output_path.relative_to(self.server.project_root).as_posix()
+            except ValueError:
+                saved_image = str(output_path)
+
+        response: Dict[str, Any] = {
+            "status": "ok",
+            "image_url": f"/api/render/{render_id}.png",
+            "elapsed_seconds": elapsed,
+            "saved_image": saved_image,
+            "quality": applied_quality,
+        }
+        if not payload.get("inline"):
+            return json.dumps(response).encode("utf-8")
+        # Scripted clients may still ask for the image embedded in the JSON.
+        # The base64 text is spliced in verbatim rather than scanned by json.dumps.
+        return _splice_json_field(
+            json.dumps(response).encode("utf-8"),
+            "image_data_url",
+            b"data:image/png;base64,",
+            base64.b64encode(png_bytes),
+        )
+
+    def _handle_render_image(self, render_id: str) -> None:
+        png_bytes = self.server.fetch_render(render_id)
+        if png_bytes is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "Render expired or unknown")
+            return
+        self._send_bytes(png_bytes, content_type="image/png")
+
     def _handle_debug(self) -> None:
         try:
             payload = self._parse_json_body()
             command = payload.get("command", "")
-            stdout, stderr = _execute_debug_command(str(command), self.server.debug_globals)
+            namespace = self.server.debug_globals
+            if "generate_star_chart" not in namespace:
+                # Deferred so the render stack is imported by the workers only.
+                from star_chart_generator import generate_star_chart
+
+                namespace["generate_star_chart"] = generate_star_chart
+            stdout, stderr = _execute_debug_command(str(command), namespace)
             self._send_json({"status": "ok", "stdout": stdout, "stderr": stderr})
         except Exception as exc:  # pragma: no cover - error reporting path
             self._send_json(
@@ -564,6 +920,8 @@ class RequestHandler(BaseHTTPRequestHandler):
             self._handle_index()
         elif parsed.path == "/api/configs":
             self._handle_list_configs()
+        elif parsed.path.startswith("/api/render/") and parsed.path.endswith(".png"):
+            self._handle_render_image(parsed.path[len("/api/render/") : -len(".png")])
         else:
             self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
 
@@ -591,6 +949,13 @@ def main() -> None:
     parser.add_argument("--config-dir", type=Path, default=DEFAULT_CONFIG_DIR, help="Directory that contains YAML configs")
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Directory where rendered PNGs are saved")
     parser.add_argument("--no-browser", action="store_true", help="Do not open the interface in a browser automatically")
+    parser.add_argument("--workers", type=int, default=None, help="Render worker processes (default: CPU count)")
+    parser.add_argument(
+        "--renders-per-worker",
+        type=int,
+        default=RENDERS_PER_WORKER,
+        help=f"Renders before a worker process is replaced; 0 never replaces it (default: {RENDERS_PER_WORKER})",
+    )
     args = parser.parse_args()
 
     handler = RequestHandler
@@ -600,6 +965,8 @@ def main() -> None:
         project_root=PROJECT_ROOT,
         config_dir=args.config_dir,
         output_dir=args.output_dir,
+        render_workers=args.workers,
+        renders_per_worker=args.renders_per_worker,
     )
 
     host, port = server.server_address
@@ -1,7 +1,26 @@
 """Star chart generator package."""
 from __future__ import annotations
 
+from typing import Any
+
 from .config import QualityPreset, SceneConfig
-from .render import RenderResult, generate_star_chart
 
 __all__ = ["SceneConfig", "QualityPreset", "RenderResult", "generate_star_chart"]
+
+# The render stack is only imported on first use so that callers which merely
+# load configurations (config listings, ``--help``) skip its import cost.
+_LAZY_RENDER_EXPORTS = {"RenderResult", "generate_star_chart"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_RENDER_EXPORTS:
+        from . import render
+
+        value = getattr(render, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_RENDER_EXPORTS)
@@ -2,14 +2,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from itertools import repeat
+from typing import Callable, Iterable, List, MutableSequence, Sequence, Tuple
 
 import math
+import struct
 
 from .config import Camera, Resolution, RingConfig
 
+# Points are clamped to this camera depth so rings crossing the camera plane
+# never divide by zero. The clamp is a conditional expression: in CPython it
+# costs the same as the old ``if`` statement, whereas ``max()`` adds a call.
+_MIN_DEPTH = 1e-5
 
-@dataclass(frozen=True)
+# Packed little-endian layout of :meth:`ProjectionParams.as_record`: width and
+# height as int32, then centre, focal length, distance, unit scale and the
+# pitch cosine/sine as float32 (36 bytes), ready for a GPU uniform buffer.
+PROJECTION_RECORD = struct.Struct("<2i7f")
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectionParams:
     """Pre-computed camera parameters used for projecting ring geometry."""
 
@@ -23,34 +35,198 @@ class ProjectionParams:
     unit_scale: float
     pixel_to_radius: float
     pitch: float
+    cos_pitch: float
+    sin_pitch: float
 
     def project(self, radius: float, angle: float) -> Tuple[float, float, float]:
-        """Project a point on a ring with ``radius`` and ``angle`` in radians."""
-
-        radius = max(0.0, radius)
-        x_world = math.cos(angle) * radius * self.unit_scale
-        y_world = math.sin(angle) * radius * self.unit_scale
-        y_prime = y_world * math.cos(self.pitch)
-        z_prime = -y_world * math.sin(self.pitch)
-        z_camera = self.distance - z_prime
-        if z_camera <= 1e-5:
-            z_camera = 1e-5
-        screen_x = self.center_x + (self.focal_length * x_world) / z_camera
-        screen_y = self.center_y + (self.focal_length * y_prime) / z_camera
-        return screen_x, screen_y, z_camera
+        """Project a point on a ring with ``radius`` and ``angle`` in radians.
+
+        ``radius`` must be non-negative: ring and label radii are validated when
+        the configuration is parsed, so the per-point path skips the check.
+        Use :meth:`project_safe` for radii that may be negative.
+        """
+
+        return self.projector()(radius, angle)
+
+    def as_record(self) -> bytes:
+        """Return the projection packed as a :data:`PROJECTION_RECORD` (float32)."""
+
+        return PROJECTION_RECORD.pack(
+            self.width,
+            self.height,
+            self.center_x,
+            self.center_y,
+            self.focal_length,
+            self.distance,
+            self.unit_scale,
+            self.cos_pitch,
+            self.sin_pitch,
+        )
+
+    def project_safe(self, radius: float, angle: float) -> Tuple[float, float, float]:
+        """Like :meth:`project`, clamping a negative ``radius`` to the centre."""
+
+        return self.project(max(0.0, radius), angle)
+
+    def projector(self) -> Callable[[float, float], Tuple[float, float, float]]:
+        """Return a standalone function projecting ``(radius, angle)`` points.
+
+        This is the one implementation of the per-point maths; :meth:`project`
+        and :meth:`project_into` are built on it. The camera constants are
+        captured as closure variables, so each call reads locals instead of
+        looking attributes up on the dataclass. A level camera (zero pitch
+        sine) puts every point at depth ``distance``, so it gets a closure
+        without the depth term or clamp.
+        """
+
+        if self.sin_pitch == 0.0 and self.cos_pitch == 1.0:
+            return _make_flat_projector(
+                self.center_x, self.center_y, self.focal_length, self.unit_scale, self.distance
+            )
+        return _make_projector(
+            self.center_x,
+            self.center_y,
+            self.focal_length,
+            self.distance,
+            self.unit_scale,
+            self.cos_pitch,
+            self.sin_pitch,
+        )
+
+    def project_many(
+        self, radii: Iterable[float], angles: Sequence[float]
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Project paired ``radii``/``angles``; return ``(xs, ys, depths)`` lists.
+
+        Matches :meth:`project` point for point, with the per-scene invariants
+        looked up once instead of on every call.
+        """
+
+        count = len(angles)
+        xs = [0.0] * count
+        ys = [0.0] * count
+        depths = [0.0] * count
+        self.project_into(radii, angles, xs, ys, depths)
+        return xs, ys, depths
+
+    def project_into(
+        self,
+        radii: Iterable[float],
+        angles: Iterable[float],
+        xs: MutableSequence[float],
+        ys: MutableSequence[float],
+        depths: MutableSequence[float],
+    ) -> int:
+        """Like :meth:`project_many` but write into preallocated buffers.
+
+        The outputs must be at least as long as the input pairs; callers that
+        project many batches can reuse the same buffers. Returns the number of
+        points written.
+        """
+
+        project = self.projector()
+        index = -1
+        for index, (radius, angle) in enumerate(zip(radii, angles)):
+            xs[index], ys[index], depths[index] = project(radius, angle)
+        return index + 1
+
+    def tessellate_ring(
+        self, radius: float, samples: int
+    ) -> List[Tuple[float, float, float, float]]:
+        """Project ``samples`` evenly spaced points of the ring at ``radius``.
+
+        Returns ``(x, y, depth, angle)`` tuples, projected by
+        :meth:`project_into`.
+        """
+
+        tau = math.tau
+        angles = [(index / samples) * tau for index in range(samples)]
+        xs, ys, depths = self.project_many(repeat(radius, samples), angles)
+        return list(zip(xs, ys, depths, angles))
 
     def ellipse_parameters(self, radius: float) -> Tuple[float, float, float]:
         """Return the vertical center and radii of the projected ellipse."""
 
-        if radius <= 0:
-            return self.center_y, 0.0, 0.0
-        side_x, side_y, _ = self.project(radius, 0.0)
-        near_x, near_y, _ = self.project(radius, math.pi / 2.0)
-        far_x, far_y, _ = self.project(radius, -math.pi / 2.0)
-        center_y = (near_y + far_y) * 0.5
-        radius_x = abs(side_x - self.center_x)
-        radius_y = abs(near_y - center_y)
-        return center_y, radius_x, radius_y
+        centers, radii_x, radii_y = self.ellipse_parameters_many((radius,))
+        return centers[0], radii_x[0], radii_y[0]
+
+    def ellipse_parameters_many(
+        self, radii: Iterable[float]
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Batch :meth:`ellipse_parameters`; return ``(centers_y, radii_x, radii_y)``."""
+
+        # The ellipse is spanned by the ring points at 0 and ±90°.
+        project = self.projector()
+        center_x = self.center_x
+        center_y0 = self.center_y
+        half_pi = math.pi / 2.0
+        centers: List[float] = []
+        radii_x: List[float] = []
+        radii_y: List[float] = []
+        for radius in radii:
+            if radius <= 0:
+                centers.append(center_y0)
+                radii_x.append(0.0)
+                radii_y.append(0.0)
+                continue
+            side_x = project(radius, 0.0)[0]
+            near_y = project(radius, half_pi)[1]
+            far_y = project(radius, -half_pi)[1]
+            center_y = (near_y + far_y) * 0.5
+            centers.append(center_y)
+            radii_x.append(abs(side_x - center_x))
+            radii_y.append(abs(near_y - center_y))
+        return centers, radii_x, radii_y
+
+
+def _make_flat_projector(
+    center_x: float, center_y: float, focal_length: float, unit_scale: float, distance: float
+) -> Callable[[float, float], Tuple[float, float, float]]:
+    cos = math.cos
+    sin = math.sin
+    # With zero pitch every point sits at depth ``distance`` and the pitch
+    # factors are exactly 0 and 1, so this matches the general closure.
+    depth = distance if distance > _MIN_DEPTH else _MIN_DEPTH
+
+    def project(radius: float, angle: float) -> Tuple[float, float, float]:
+        x_world = cos(angle) * radius * unit_scale
+        y_world = sin(angle) * radius * unit_scale
+        return (
+            center_x + (focal_length * x_world) / depth,
+            center_y + (focal_length * y_world) / depth,
+            depth,
+        )
+
+    return project
+
+
+def _make_projector(
+    center_x: float,
+    center_y: float,
+    focal_length: float,
+    distance: float,
+    unit_scale: float,
+    cos_pitch: float,
+    sin_pitch: float,
+) -> Callable[[float, float], Tuple[float, float, float]]:
+    cos = math.cos
+    sin = math.sin
+    min_depth = _MIN_DEPTH
+
+    def project(radius: float, angle: float) -> Tuple[float, float, float]:
+        # Products are taken in the original order (world units first, focal
+        # length last), so projected points match the reference bit for bit.
+        x_world = cos(angle) * radius * unit_scale
+        y_world = sin(angle) * radius * unit_scale
+        z_camera = distance + y_world * sin_pitch
+        z_camera = z_camera if z_camera > min_depth else min_depth
+        return (
+            center_x + (focal_length * x_world) / z_camera,
+            center_y + (focal_length * (y_world * cos_pitch)) / z_camera,
+            z_camera,
+        )
+
+    return project
 
 
 def create_projection(
@@ -68,16 +244,13 @@ def create_projection(
 
     distance = max(camera.z_near + 1e-3, camera.z_far)
 
-    max_radius = 0.0
-    for ring in rings:
-        radius = ring.r + max(ring.width * 0.75, 0.0)
-        if radius > max_radius:
-            max_radius = radius
+    max_radius = max((ring.r + max(ring.width * 0.75, 0.0) for ring in rings), default=0.0)
     if max_radius <= 1e-6:
         max_radius = 1.0
 
     unit_scale = base_radius * distance / (focal_length * max_radius)
     pixel_to_radius = distance / (focal_length * unit_scale)
+    pitch = math.radians(camera.pitch_deg)
 
     return ProjectionParams(
         width=width,
@@ -89,8 +262,10 @@ def create_projection(
         distance=distance,
         unit_scale=unit_scale,
         pixel_to_radius=pixel_to_radius,
-        pitch=math.radians(camera.pitch_deg),
+        pitch=pitch,
+        cos_pitch=math.cos(pitch),
+        sin_pitch=math.sin(pitch),
     )
 
 
-__all__ = ["ProjectionParams", "create_projection"]
+__all__ = ["PROJECTION_RECORD", "ProjectionParams", "create_projection"]
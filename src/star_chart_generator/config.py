@@ -1,18 +1,36 @@
 """Configuration structures for the star chart generator."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-import ast
+import hashlib
+import json
 import math
+import os
+import re
+import tempfile
+
+from .utils import hex_to_rgb
 
 try:  # pragma: no cover - optional dependency
     import yaml  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - fallback to pure python parser
     yaml = None
+    _YamlLoader = None
+else:  # pragma: no cover - exercised when PyYAML is available
+    # Prefer the libyaml C loader; PyYAML builds without it only ship SafeLoader.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:  # pragma: no cover - standard library on Python 3.11+
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - Python 3.10
+    tomllib = None
 
 
 class QualityPreset(str, Enum):
@@ -39,7 +57,7 @@ class QualityPreset(str, Enum):
         raise ValueError(f"Unknown quality preset: {value}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Resolution:
     """Output resolution configuration."""
 
@@ -52,7 +70,7 @@ class Resolution:
         return self.width * self.ssaa, self.height * self.ssaa
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Camera:
     """Camera orientation and projection settings."""
 
@@ -61,6 +79,13 @@ class Camera:
     fov_deg: float = 35.0
     z_near: float = 0.1
     z_far: float = 6.0
+    _pitch_radians: float = field(init=False, repr=False, compare=False)
+    _ellipse_ratio: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pitch_radians = math.radians(self.pitch_deg)
+        object.__setattr__(self, "_pitch_radians", pitch_radians)
+        object.__setattr__(self, "_ellipse_ratio", math.cos(pitch_radians))
 
     @property
     def tilt_deg(self) -> float:
@@ -70,16 +95,16 @@ class Camera:
 
     @property
     def pitch_radians(self) -> float:
-        return math.radians(self.pitch_deg)
+        return self._pitch_radians
 
     @property
     def ellipse_ratio(self) -> float:
         """Approximate squish factor retained for backwards compatibility."""
 
-        return math.cos(self.pitch_radians)
+        return self._ellipse_ratio
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RingTickConfig:
     """Tick placement parameters for a ring."""
 
@@ -89,14 +114,14 @@ class RingTickConfig:
     weight: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RingConfig:
     """Parameters describing a single UI ring."""
 
     r: float
     width: float
     color: str
-    dash: Optional[Sequence[float]] = None
+    dash: Optional[Tuple[float, ...]] = None
     ticks_every_deg: Optional[float] = None
     label: Optional[str] = None
     label_angle_deg: Optional[float] = None
@@ -106,7 +131,32 @@ class RingConfig:
     tick: Optional[RingTickConfig] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class RingArrays:
+    """Struct-of-arrays view of the rings, built once per configuration.
+
+    Passes that sweep every ring read these parallel columns instead of
+    fetching attributes (and re-parsing colours) ring by ring.
+    """
+
+    radii: Tuple[float, ...] = ()
+    widths: Tuple[float, ...] = ()
+    glows: Tuple[float, ...] = ()
+    colors: Tuple[Tuple[float, float, float], ...] = ()
+    halo_colors: Tuple[Tuple[float, float, float], ...] = ()
+
+    @classmethod
+    def from_rings(cls, rings: Sequence[RingConfig]) -> "RingArrays":
+        return cls(
+            radii=tuple(ring.r for ring in rings),
+            widths=tuple(ring.width for ring in rings),
+            glows=tuple(ring.glow for ring in rings),
+            colors=tuple(hex_to_rgb(ring.color) for ring in rings),
+            halo_colors=tuple(hex_to_rgb(ring.halo_color or ring.color) for ring in rings),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class ReadoutPlacement:
     """Placement description for a numeric readout."""
 
@@ -117,7 +167,7 @@ class ReadoutPlacement:
     radial_offset: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadoutConfig:
     """Configuration for a numeric readout rendered near a ring."""
 
@@ -126,7 +176,7 @@ class ReadoutConfig:
     placement: ReadoutPlacement
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulgeDistribution:
     """Configuration for the dense stellar bulge."""
 
@@ -136,7 +186,7 @@ class BulgeDistribution:
     size_px: Tuple[float, float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackgroundDistribution:
     """Configuration for the sparse background stars."""
 
@@ -147,7 +197,7 @@ class BackgroundDistribution:
     max_r: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StarConfig:
     """Aggregate settings for star sampling."""
 
@@ -156,9 +206,29 @@ class StarConfig:
     warm_color: str = "#E8B551"
     hot_color: str = "#FFFFFF"
     background_color: str = "#CFA05A"
+    _warm_rgb: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+    _hot_rgb: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+    _background_rgb: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_warm_rgb", hex_to_rgb(self.warm_color))
+        object.__setattr__(self, "_hot_rgb", hex_to_rgb(self.hot_color))
+        object.__setattr__(self, "_background_rgb", hex_to_rgb(self.background_color))
+
+    @property
+    def warm_rgb(self) -> Tuple[float, float, float]:
+        return self._warm_rgb
+
+    @property
+    def hot_rgb(self) -> Tuple[float, float, float]:
+        return self._hot_rgb
+
+    @property
+    def background_rgb(self) -> Tuple[float, float, float]:
+        return self._background_rgb
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextConfig:
     """Typography settings."""
 
@@ -167,9 +237,24 @@ class TextConfig:
     color: str = "#e6f5ff"
     tracking: float = -0.5
     tabular_digits: bool = True
+    _rgb: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_rgb", hex_to_rgb(self.color))
+
+    @property
+    def rgb(self) -> Tuple[float, float, float]:
+        """``color`` as linear RGB floats, converted once when the config is built."""
+
+        return self._rgb
+
+
+# Shared default instances: the configs are frozen, so one object can safely
+# serve as the default for every scene instead of a per-instance factory call.
+_DEFAULT_TEXT = TextConfig()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HUDReadout:
     """Configuration for a HUD readout displayed along the bottom band."""
 
@@ -178,7 +263,7 @@ class HUDReadout:
     alignment: str = "center"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HUDConfig:
     """Settings controlling the bottom HUD overlay."""
 
@@ -186,44 +271,57 @@ class HUDConfig:
     height_px: int = 180
     font: Optional[str] = None
     emissive: float = 1.3
-    readouts: Tuple[HUDReadout, ...] = field(default_factory=tuple)
+    readouts: Tuple[HUDReadout, ...] = ()
     use_default_readouts: bool = True
 
 
-@dataclass(frozen=True)
+_DEFAULT_HUD = HUDConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class BloomConfig:
     threshold: float = 0.75
     sigmas: Tuple[float, ...] = (2.0, 6.0, 12.0)
     intensities: Tuple[float, ...] = (0.7, 0.4, 0.2)
 
 
-@dataclass(frozen=True)
+_DEFAULT_BLOOM = BloomConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class ChromaticAberrationConfig:
     pixels: float = 1.2
     center: Optional[Tuple[float, float]] = None
 
 
-@dataclass(frozen=True)
+_DEFAULT_CHROMATIC_ABERRATION = ChromaticAberrationConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class AnamorphicConfig:
     enabled: bool = True
     length_px: float = 80.0
     intensity: float = 0.15
 
 
-@dataclass(frozen=True)
+_DEFAULT_ANAMORPHIC = AnamorphicConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class PostConfig:
-    bloom: BloomConfig = field(default_factory=BloomConfig)
-    chromatic_aberration: ChromaticAberrationConfig = field(
-        default_factory=ChromaticAberrationConfig
-    )
-    anamorphic: AnamorphicConfig = field(default_factory=AnamorphicConfig)
+    bloom: BloomConfig = _DEFAULT_BLOOM
+    chromatic_aberration: ChromaticAberrationConfig = _DEFAULT_CHROMATIC_ABERRATION
+    anamorphic: AnamorphicConfig = _DEFAULT_ANAMORPHIC
     vignette: float = 0.25
     grain: float = 0.03
     tonemap: str = "filmic"
     gamma: float = 2.2
 
 
-@dataclass(frozen=True)
+_DEFAULT_POST = PostConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class _QualityProfile:
     """Collection of scalar overrides applied by :class:`QualityPreset`."""
 
@@ -279,42 +377,409 @@ _QUALITY_PROFILES: Dict[QualityPreset, _QualityProfile] = {
 }
 
 
-@dataclass(frozen=True)
+def _f(value: Any) -> float:
+    """``float(value)``, skipping the call when ``value`` already is a float."""
+
+    return value if type(value) is float else float(value)
+
+
+def _i(value: Any) -> int:
+    """``int(value)``, skipping the call when ``value`` already is an int."""
+
+    return value if type(value) is int else int(value)
+
+
+def _s(value: Any) -> str:
+    """``str(value)``, skipping the call when ``value`` already is a str."""
+
+    return value if type(value) is str else str(value)
+
+
+# ``(key, type, default)`` tables for sections whose keys map one-to-one onto
+# dataclass fields; :func:`_coerce` reads them in a single pass.
+_Schema = Tuple[Tuple[str, Callable[[Any], Any], Any], ...]
+
+_CAMERA_SCHEMA: _Schema = (
+    ("yaw_deg", _f, 0.0),
+    ("fov_deg", _f, 35.0),
+    ("z_near", _f, 0.1),
+    ("z_far", _f, 6.0),
+)
+_BACKGROUND_SCHEMA: _Schema = (
+    ("count", _i, 3500),
+    ("jitter", _f, 0.3),
+    ("min_r", _f, 0.0),
+    ("max_r", _f, 1.0),
+)
+_STAR_COLOR_SCHEMA: _Schema = (
+    ("warm_color", _s, "#E8B551"),
+    ("hot_color", _s, "#FFFFFF"),
+    ("background_color", _s, "#CFA05A"),
+)
+_TEXT_SCHEMA: _Schema = (
+    ("size_px", _i, 26),
+    ("color", _s, "#e6f5ff"),
+    ("tracking", _f, -0.5),
+    ("tabular_digits", bool, True),
+)
+_ANAMORPHIC_SCHEMA: _Schema = (
+    ("enabled", bool, True),
+    ("intensity", _f, 0.15),
+)
+_POST_SCHEMA: _Schema = (
+    ("vignette", _f, 0.25),
+    ("grain", _f, 0.03),
+    ("tonemap", _s, "filmic"),
+    ("gamma", _f, 2.2),
+)
+
+# Exact-type checks short-circuit the isinstance() fallback for the plain
+# containers produced by the YAML/JSON loaders; subclasses are still accepted.
+_SEQUENCE_TYPES = (list, tuple)
+
+_DECIMAL = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+# ``"x, y"`` (extra comma-separated numbers are ignored) for the chromatic
+# aberration centre; names such as ``"center"`` simply do not match.
+_CENTER_PAIR_RE = re.compile(
+    rf"\s*({_DECIMAL})\s*,\s*({_DECIMAL})\s*(?:,\s*{_DECIMAL}\s*)*"
+)
+
+# Accepted spellings of readout alignments, mapped to their canonical value.
+_ALIGNMENT_MAP: Dict[str, str] = {
+    "center": "center",
+    "middle": "center",
+    "start": "start",
+    "left": "start",
+    "begin": "start",
+    "end": "end",
+    "right": "end",
+}
+
+
+def _floats_skipping_invalid(values: Sequence[Any]) -> List[float]:
+    """Convert ``values`` to floats, dropping entries that are not numeric."""
+
+    try:
+        # Well-formed lists convert in one C-level pass.
+        return list(map(float, values))
+    except (TypeError, ValueError):
+        pass
+    result: List[float] = []
+    for value in values:
+        try:
+            result.append(float(value))
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def _coerce_pair(value: Any, default: Tuple[float, float]) -> Tuple[float, float]:
+    """Read a ``(low, high)`` pair from a scalar or a one/two element list."""
+
+    if (type(value) in _SEQUENCE_TYPES or isinstance(value, _SEQUENCE_TYPES)) and value:
+        if len(value) == 1:
+            val = float(value[0])
+            return (val, val)
+        return (float(value[0]), float(value[1]))
+    if value is not None:
+        try:
+            val = float(value)
+        except (TypeError, ValueError):
+            return default
+        return (val, val)
+    return default
+
+
+def _coerce_float_tuple(value: Any) -> Tuple[float, ...]:
+    """Read a scalar or list as a tuple of floats, skipping invalid entries."""
+
+    if type(value) in _SEQUENCE_TYPES or isinstance(value, _SEQUENCE_TYPES):
+        return tuple(_floats_skipping_invalid(value))
+    if value is not None:
+        try:
+            return (float(value),)
+        except (TypeError, ValueError):
+            return tuple()
+    return tuple()
+
+
+# ``(alias, canonical)`` spellings per section. Canonical keys keep priority
+# over their aliases, and earlier aliases over later ones.
+_Aliases = Tuple[Tuple[str, str], ...]
+
+_CAMERA_ALIASES: _Aliases = (("tilt_deg", "pitch_deg"),)
+_TICK_ALIASES: _Aliases = (("spacing", "every_deg"), ("length", "length_px"))
+_PLACEMENT_ALIASES: _Aliases = (
+    ("kind", "type"),
+    ("ring_index", "ring"),
+    ("radial_offset", "offset"),
+)
+_STARS_ALIASES: _Aliases = (("core", "bulge"), ("bg", "background"), ("halo", "background"))
+_BULGE_ALIASES: _Aliases = (("alpha", "falloff_alpha"),)
+_POST_ALIASES: _Aliases = (("chromatic_aberration", "chromab"),)
+_CHROMA_ALIASES: _Aliases = (("k", "pixels"),)
+_ANAMORPHIC_ALIASES: _Aliases = (("length", "length_px"),)
+_HUD_ALIASES: _Aliases = (("height", "height_px"),)
+_HUD_READOUT_ALIASES: _Aliases = (("x", "position"), ("u", "position"))
+
+
+def _rename_aliases(data: Dict[str, Any], aliases: _Aliases) -> Dict[str, Any]:
+    """Return ``data`` with alias keys folded into their canonical names.
+
+    The input is only copied when it actually uses an alias, so sections
+    written with canonical keys are returned as-is.
+    """
+
+    renamed: Optional[Dict[str, Any]] = None
+    for alias, canonical in aliases:
+        if alias in data:
+            if renamed is None:
+                renamed = dict(data)
+            value = renamed.pop(alias)
+            if renamed.get(canonical) is None:
+                renamed[canonical] = value
+    return data if renamed is None else renamed
+
+
+def _coerce(data: Dict[str, Any], schema: _Schema) -> Dict[str, Any]:
+    """Return ``{key: kind(data.get(key, default))}`` for every schema entry."""
+
+    get = data.get
+    return {key: kind(get(key, default)) for key, kind, default in schema}
+
+
+# Shape rules checked by :func:`_validate` before any dataclass is built:
+# ``path -> (expected type, required keys, whether null means "absent")``.
+# Alias sections are nullable because alias lookup skips ``None`` values.
+# Sections accept any mapping and ring/readout lists any list or tuple, as the
+# parsers below do; only the shape is checked here.
+_MAPPING: Tuple[type, ...] = (Mapping,)
+_SEQUENCE: Tuple[type, ...] = (list, tuple)
+
+_SCENE_SCHEMA: Dict[Tuple[str, ...], Tuple[Tuple[type, ...], Tuple[str, ...], bool]] = {
+    ("resolution",): (_MAPPING, ("width", "height"), False),
+    ("rings",): (_SEQUENCE, (), False),
+    ("readouts",): (_SEQUENCE, (), False),
+    ("stars",): (_MAPPING, (), False),
+    ("stars", "bulge"): (_MAPPING, (), True),
+    ("stars", "core"): (_MAPPING, (), True),
+    ("stars", "background"): (_MAPPING, (), True),
+    ("stars", "bg"): (_MAPPING, (), True),
+    ("stars", "halo"): (_MAPPING, (), True),
+    ("text",): (_MAPPING, (), False),
+    ("post",): (_MAPPING, (), False),
+    ("post", "bloom"): (_MAPPING, (), False),
+    ("post", "chromab"): (_MAPPING, (), True),
+    ("post", "chromatic_aberration"): (_MAPPING, (), True),
+    ("post", "anamorphic"): (_MAPPING, (), False),
+}
+_REQUIRED_SECTIONS = (("resolution",),)
+_TYPE_NAMES = {_MAPPING: "a mapping", _SEQUENCE: "a list or tuple"}
+
+
+def _validate(data: Any) -> None:
+    """Check the shape of a scene mapping, raising ``ValueError`` with the path."""
+
+    if not isinstance(data, Mapping):
+        raise ValueError(f"scene: expected a mapping, got {type(data).__name__}")
+    for path in _REQUIRED_SECTIONS:
+        if path[0] not in data:
+            raise ValueError(f"{'.'.join(path)}: missing required section")
+    for path, (kind, required, nullable) in _SCENE_SCHEMA.items():
+        parent: Any = data
+        for key in path[:-1]:
+            parent = parent.get(key)
+        if parent is None or path[-1] not in parent:
+            continue
+        value = parent[path[-1]]
+        if value is None and nullable:
+            continue
+        if not isinstance(value, kind):
+            raise ValueError(
+                f"{'.'.join(path)}: expected {_TYPE_NAMES[kind]}, got {type(value).__name__}"
+            )
+        for key in required:
+            if key not in value:
+                raise ValueError(f"{'.'.join(path)}.{key}: missing required key")
+
+
+def _build_tick(tick_data: Dict[str, Any]) -> Optional[RingTickConfig]:
+    tick_data = _rename_aliases(tick_data, _TICK_ALIASES)
+    every_raw = tick_data.get("every_deg")
+    every: Tuple[float, ...] = ()
+    if isinstance(every_raw, (int, float)):
+        # A single spacing needs no filtering pass or sort.
+        spacing = float(every_raw)
+        if spacing > 0:
+            every = (spacing,)
+    elif type(every_raw) in _SEQUENCE_TYPES or isinstance(every_raw, _SEQUENCE_TYPES):
+        every = tuple(sorted(value for value in _floats_skipping_invalid(every_raw) if value > 0))
+    length_raw = tick_data.get("length_px")
+    lengths: Tuple[float, float]
+    if isinstance(length_raw, (int, float)):
+        length_value = float(length_raw)
+        lengths = (length_value, length_value)
+    elif (
+        type(length_raw) in _SEQUENCE_TYPES or isinstance(length_raw, _SEQUENCE_TYPES)
+    ) and length_raw:
+        first = float(length_raw[0])
+        second = float(length_raw[1] if len(length_raw) > 1 else length_raw[0])
+        lengths = (first, second)
+    else:
+        lengths = (8.0, 14.0)
+    if not every:
+        return None
+    lo, hi = min(lengths), max(lengths)
+    return RingTickConfig(
+        every_deg=every,
+        length_px=(lo, hi),
+        alpha=_f(tick_data.get("alpha", 0.8)),
+        weight=_f(tick_data.get("weight", 1.0)),
+    )
+
+
+def _build_ring(item: Any) -> Optional[RingConfig]:
+    """Parse one ``rings`` entry, returning ``None`` for entries that are skipped."""
+
+    if type(item) is not dict and not isinstance(item, dict):
+        return None
+    if "r" not in item or "color" not in item:
+        return None
+    tick_data = item.get("tick")
+    tick_spec = (
+        _build_tick(tick_data)
+        if type(tick_data) is dict or isinstance(tick_data, dict)
+        else None
+    )
+
+    ring_radius = _f(item.get("r", 0.0))
+    ring_width = _f(item.get("width", 0.006))
+    if ring_radius < 0.0 or ring_width < 0.0:
+        raise ValueError(
+            f"Ring r={ring_radius} width={ring_width} must have a non-negative radius and width"
+        )
+    color = _s(item["color"])
+    halo_raw = item.get("halo_color")
+    dash_raw = item.get("dash")
+    return RingConfig(
+        r=ring_radius,
+        width=ring_width,
+        color=color,
+        dash=tuple(map(float, dash_raw)) if dash_raw else None,
+        ticks_every_deg=_f(item["ticks_every_deg"])
+        if "ticks_every_deg" in item
+        else None,
+        label=item.get("label"),
+        label_angle_deg=_f(item["label_angle_deg"])
+        if "label_angle_deg" in item
+        else None,
+        label_offset=_f(item.get("label_offset", 0.015)),
+        glow=_f(item.get("glow", 1.0)),
+        halo_color=_s(halo_raw) if halo_raw is not None else color,
+        tick=tick_spec,
+    )
+
+
+def _build_readout(item: Any) -> Optional[ReadoutConfig]:
+    """Parse one ``readouts`` entry, returning ``None`` for entries that are skipped."""
+
+    if type(item) is not dict and not isinstance(item, dict):
+        return None
+    if "text" not in item:
+        return None
+    text_value = _s(item.get("text", ""))
+    alignment_raw = _s(item.get("alignment", "center")).lower()
+    alignment = _ALIGNMENT_MAP.get(alignment_raw, "center")
+    placement_data = item.get("placement", {})
+    if type(placement_data) is not dict and not isinstance(placement_data, dict):
+        return None
+    placement_data = _rename_aliases(placement_data, _PLACEMENT_ALIASES)
+    kind = _s(placement_data.get("type", "arc")).lower()
+    if kind not in {"arc", "linear"}:
+        kind = "arc"
+    ring_index = _i(placement_data.get("ring", 0))
+    angle_deg = _f(placement_data.get("angle_deg", 90.0))
+    radius_value = placement_data.get("radius")
+    radius = float(radius_value) if radius_value is not None else None
+    if radius is not None and radius < 0.0:
+        raise ValueError(f"Readout {text_value!r} has a negative placement radius")
+    radial_offset = _f(placement_data.get("offset", 0.0))
+    return ReadoutConfig(
+        text=text_value,
+        alignment=alignment,
+        placement=ReadoutPlacement(
+            kind=kind,
+            ring_index=ring_index,
+            angle_deg=angle_deg,
+            radius=radius,
+            radial_offset=radial_offset,
+        ),
+    )
+
+
+def _build_hud_readout(item: Any) -> Optional[HUDReadout]:
+    """Parse one ``hud.readouts`` entry, returning ``None`` for entries that are skipped."""
+
+    if type(item) is not dict and not isinstance(item, dict):
+        return None
+    text_value = _s(item.get("text", "")).strip()
+    if not text_value:
+        return None
+    position_raw = _rename_aliases(item, _HUD_READOUT_ALIASES).get("position", 0.5)
+    try:
+        position = float(position_raw)
+    except (TypeError, ValueError):
+        position = 0.5
+    position = max(0.0, min(1.0, position))
+    alignment_raw = _s(item.get("alignment", "center")).lower()
+    alignment = _ALIGNMENT_MAP.get(alignment_raw, "center")
+    return HUDReadout(text=text_value, position=position, alignment=alignment)
+
+
+@dataclass(frozen=True, slots=True)
 class SceneConfig:
     """Top level configuration for a star chart scene."""
 
     seed: int
     resolution: Resolution
     camera: Camera
-    rings: List[RingConfig]
+    rings: Tuple[RingConfig, ...]
     stars: StarConfig
-    readouts: List[ReadoutConfig] = field(default_factory=list)
-    text: TextConfig = field(default_factory=TextConfig)
-    post: PostConfig = field(default_factory=PostConfig)
-    hud: HUDConfig = field(default_factory=HUDConfig)
+    readouts: Tuple[ReadoutConfig, ...] = ()
+    text: TextConfig = _DEFAULT_TEXT
+    post: PostConfig = _DEFAULT_POST
+    hud: HUDConfig = _DEFAULT_HUD
     lut: Optional[str] = None
     name: Optional[str] = None
+    ring_arrays: RingArrays = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ring_arrays", RingArrays.from_rings(self.rings))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], *, base_path: Optional[Path] = None) -> "SceneConfig":
-        """Construct a :class:`SceneConfig` from a dictionary."""
+        """Construct a :class:`SceneConfig` from a dictionary.
+
+        Raises :class:`ValueError` naming the offending path (for example
+        ``resolution.width``) when the mapping does not have the expected shape.
+        """
 
-        resolution_data = data.get("resolution", {})
+        _validate(data)
+        resolution_data = data["resolution"]
         resolution = Resolution(
-            width=int(resolution_data["width"]),
-            height=int(resolution_data["height"]),
-            ssaa=int(resolution_data.get("ssaa", 1)),
+            width=_i(resolution_data["width"]),
+            height=_i(resolution_data["height"]),
+            ssaa=_i(resolution_data.get("ssaa", 1)),
         )
 
         camera_data = data.get("camera", {})
         if not isinstance(camera_data, dict):
             camera_data = {}
+        camera_data = _rename_aliases(camera_data, _CAMERA_ALIASES)
         pitch_value_raw = None
         if isinstance(camera_data, dict):
             if "pitch_deg" in camera_data:
                 pitch_value_raw = camera_data.get("pitch_deg")
-            elif "tilt_deg" in camera_data:
-                pitch_value_raw = camera_data.get("tilt_deg")
             else:
                 ellipse_value = camera_data.get("ellipse_ratio")
                 if ellipse_value is not None:
@@ -325,198 +790,52 @@ class SceneConfig:
                     except (TypeError, ValueError):
                         pitch_value_raw = None
         pitch_value = float(pitch_value_raw) if pitch_value_raw is not None else 83.0
-        camera = Camera(
-            pitch_deg=pitch_value,
-            yaw_deg=float(camera_data.get("yaw_deg", 0.0)),
-            fov_deg=float(camera_data.get("fov_deg", 35.0)),
-            z_near=float(camera_data.get("z_near", 0.1)),
-            z_far=float(camera_data.get("z_far", 6.0)),
-        )
-
-        rings: List[RingConfig] = []
-        for item in data.get("rings", []):
-            if not isinstance(item, dict):
-                continue
-            if "r" not in item or "color" not in item:
-                continue
-            tick_spec: Optional[RingTickConfig] = None
-            tick_data = item.get("tick")
-            if isinstance(tick_data, dict):
-                every_raw = tick_data.get("every_deg", tick_data.get("spacing"))
-                every: List[float] = []
-                if isinstance(every_raw, (int, float)):
-                    every.append(float(every_raw))
-                elif isinstance(every_raw, (list, tuple)):
-                    for value in every_raw:
-                        try:
-                            every.append(float(value))
-                        except (TypeError, ValueError):
-                            continue
-                every = [value for value in every if value > 0]
-                length_raw = tick_data.get("length_px", tick_data.get("length"))
-                lengths: Tuple[float, float]
-                if isinstance(length_raw, (int, float)):
-                    length_value = float(length_raw)
-                    lengths = (length_value, length_value)
-                elif isinstance(length_raw, (list, tuple)) and length_raw:
-                    first = float(length_raw[0])
-                    second = float(length_raw[1] if len(length_raw) > 1 else length_raw[0])
-                    lengths = (first, second)
-                else:
-                    lengths = (8.0, 14.0)
-                if every:
-                    lo, hi = min(lengths), max(lengths)
-                    tick_spec = RingTickConfig(
-                        every_deg=tuple(sorted(every)),
-                        length_px=(lo, hi),
-                        alpha=float(tick_data.get("alpha", 0.8)),
-                        weight=float(tick_data.get("weight", 1.0)),
-                    )
-
-            rings.append(
-                RingConfig(
-                    r=float(item.get("r", 0.0)),
-                    width=float(item.get("width", 0.006)),
-                    color=str(item.get("color", "#ffffff")),
-                    dash=tuple(item.get("dash", [])) or None,
-                    ticks_every_deg=float(item["ticks_every_deg"])
-                    if "ticks_every_deg" in item
-                    else None,
-                    label=item.get("label"),
-                    label_angle_deg=float(item["label_angle_deg"])
-                    if "label_angle_deg" in item
-                    else None,
-                    label_offset=float(item.get("label_offset", 0.015)),
-                    glow=float(item.get("glow", 1.0)),
-                    halo_color=str(item.get("halo_color", item.get("color", "#ffffff"))),
-                    tick=tick_spec,
-                )
-            )
+        camera = Camera(pitch_deg=pitch_value, **_coerce(camera_data, _CAMERA_SCHEMA))
 
-        readouts: List[ReadoutConfig] = []
-        for item in data.get("readouts", []):
-            if not isinstance(item, dict):
-                continue
-            if "text" not in item:
-                continue
-            text_value = str(item.get("text", ""))
-            alignment_raw = str(item.get("alignment", "center")).lower()
-            alignment_map = {
-                "center": "center",
-                "middle": "center",
-                "start": "start",
-                "left": "start",
-                "begin": "start",
-                "end": "end",
-                "right": "end",
-            }
-            alignment = alignment_map.get(alignment_raw, "center")
-            placement_data = item.get("placement", {})
-            if not isinstance(placement_data, dict):
-                continue
-            kind = str(placement_data.get("type", placement_data.get("kind", "arc"))).lower()
-            if kind not in {"arc", "linear"}:
-                kind = "arc"
-            ring_index = int(placement_data.get("ring", placement_data.get("ring_index", 0)))
-            angle_deg = float(placement_data.get("angle_deg", 90.0))
-            radius_value = placement_data.get("radius")
-            radius = float(radius_value) if radius_value is not None else None
-            radial_offset = float(
-                placement_data.get("offset", placement_data.get("radial_offset", 0.0))
-            )
-            readouts.append(
-                ReadoutConfig(
-                    text=text_value,
-                    alignment=alignment,
-                    placement=ReadoutPlacement(
-                        kind=kind,
-                        ring_index=ring_index,
-                        angle_deg=angle_deg,
-                        radius=radius,
-                        radial_offset=radial_offset,
-                    ),
-                )
-            )
+        rings = [ring for ring in map(_build_ring, data.get("rings", [])) if ring is not None]
 
-        def _pair(value: Any, default: Tuple[float, float]) -> Tuple[float, float]:
-            if isinstance(value, (list, tuple)) and value:
-                if len(value) == 1:
-                    val = float(value[0])
-                    return (val, val)
-                return (float(value[0]), float(value[1]))
-            if value is not None:
-                try:
-                    val = float(value)
-                except (TypeError, ValueError):
-                    return default
-                return (val, val)
-            return default
+        readouts = [
+            readout
+            for readout in map(_build_readout, data.get("readouts", []))
+            if readout is not None
+        ]
 
         stars_data = data.get("stars", {})
-        bulge_data = stars_data.get("bulge", stars_data.get("core", {}))
-        background_data = stars_data.get(
-            "background", stars_data.get("bg", stars_data.get("halo", {}))
-        )
+        stars_data = _rename_aliases(stars_data, _STARS_ALIASES)
+        bulge_data = _rename_aliases(stars_data.get("bulge") or {}, _BULGE_ALIASES)
+        background_data = stars_data.get("background") or {}
 
         size_default = (
-            float(stars_data.get("min_size_px", 0.6)),
-            float(stars_data.get("max_size_px", 2.6)),
+            _f(stars_data.get("min_size_px", 0.6)),
+            _f(stars_data.get("max_size_px", 2.6)),
         )
-        bulge_size = _pair(bulge_data.get("size_px", size_default), (1.0, 2.5))
-        background_size = _pair(
+        bulge_size = _coerce_pair(bulge_data.get("size_px", size_default), (1.0, 2.5))
+        background_size = _coerce_pair(
             background_data.get("size_px", size_default), (0.6, 1.6)
         )
 
         stars = StarConfig(
             bulge=BulgeDistribution(
-                count=int(bulge_data.get("count", 12000)),
-                sigma=float(bulge_data.get("sigma", 0.14)),
-                falloff_alpha=float(
-                    bulge_data.get("falloff_alpha", bulge_data.get("alpha", 1.8))
+                count=_i(bulge_data.get("count", 12000)),
+                sigma=_f(bulge_data.get("sigma", 0.14)),
+                falloff_alpha=_f(
+                    bulge_data.get("falloff_alpha", 1.8)
                 ),
                 size_px=bulge_size,
             ),
             background=BackgroundDistribution(
-                count=int(background_data.get("count", 3500)),
-                size_px=background_size,
-                jitter=float(background_data.get("jitter", 0.3)),
-                min_r=float(background_data.get("min_r", 0.0)),
-                max_r=float(background_data.get("max_r", 1.0)),
+                size_px=background_size, **_coerce(background_data, _BACKGROUND_SCHEMA)
             ),
-            warm_color=str(stars_data.get("warm_color", "#E8B551")),
-            hot_color=str(stars_data.get("hot_color", "#FFFFFF")),
-            background_color=str(stars_data.get("background_color", "#CFA05A")),
+            **_coerce(stars_data, _STAR_COLOR_SCHEMA),
         )
 
         text_data = data.get("text", {})
-        text = TextConfig(
-            font=text_data.get("font"),
-            size_px=int(text_data.get("size_px", 26)),
-            color=str(text_data.get("color", "#e6f5ff")),
-            tracking=float(text_data.get("tracking", -0.5)),
-            tabular_digits=bool(text_data.get("tabular_digits", True)),
-        )
+        text = TextConfig(font=text_data.get("font"), **_coerce(text_data, _TEXT_SCHEMA))
 
         post_data = data.get("post", {})
         bloom_data = post_data.get("bloom", {})
 
-        def _as_floats(value: Any) -> Tuple[float, ...]:
-            if isinstance(value, (list, tuple)):
-                result: List[float] = []
-                for item in value:
-                    try:
-                        result.append(float(item))
-                    except (TypeError, ValueError):
-                        continue
-                return tuple(result)
-            if value is not None:
-                try:
-                    return (float(value),)
-                except (TypeError, ValueError):
-                    return tuple()
-            return tuple()
-
-        bloom_sigmas = _as_floats(
+        bloom_sigmas = _coerce_float_tuple(
             bloom_data.get("sigma_px")
             or bloom_data.get("sigmas")
             or bloom_data.get("radius")
@@ -524,92 +843,61 @@ class SceneConfig:
         if not bloom_sigmas:
             bloom_sigmas = (2.0, 6.0, 12.0)
 
-        bloom_intensities = _as_floats(
+        bloom_intensities = _coerce_float_tuple(
             bloom_data.get("intensity") or bloom_data.get("intensities")
         )
         if not bloom_intensities:
             bloom_intensities = (0.7, 0.4, 0.2)
-        if len(bloom_intensities) == 1 and len(bloom_sigmas) > 1:
-            bloom_intensities = tuple(bloom_intensities[0] for _ in bloom_sigmas)
-        elif len(bloom_sigmas) != len(bloom_intensities):
-            bloom_intensities = tuple(
-                bloom_intensities[i % len(bloom_intensities)]
-                for i in range(len(bloom_sigmas))
-            )
-
-        chroma_data = post_data.get("chromab", post_data.get("chromatic_aberration", {}))
+        sigma_count = len(bloom_sigmas)
+        intensity_count = len(bloom_intensities)
+        if intensity_count != sigma_count:
+            # Cycle (or truncate) the intensities to one per sigma.
+            bloom_intensities = (bloom_intensities * (sigma_count // intensity_count + 1))[
+                :sigma_count
+            ]
+
+        chroma_data = _rename_aliases(
+            _rename_aliases(post_data, _POST_ALIASES).get("chromab") or {}, _CHROMA_ALIASES
+        )
         center_value = chroma_data.get("center")
-        if isinstance(center_value, (list, tuple)) and len(center_value) >= 2:
-            chroma_center: Optional[Tuple[float, float]] = (
-                float(center_value[0]),
-                float(center_value[1]),
-            )
-        else:
-            chroma_center = None
-        if isinstance(center_value, str) and center_value.strip().lower() not in {
-            "image_center",
-            "centre",
-            "center",
-        }:
-            try:
-                parts = [float(part) for part in center_value.split(",")]
-                if len(parts) >= 2:
-                    chroma_center = (parts[0], parts[1])
-            except Exception:  # pragma: no cover - defensive
-                chroma_center = None
-
-        anamorphic_data = post_data.get("anamorphic", {})
+        chroma_center: Optional[Tuple[float, float]] = None
+        if isinstance(center_value, (list, tuple)):
+            if len(center_value) >= 2:
+                chroma_center = (float(center_value[0]), float(center_value[1]))
+        elif isinstance(center_value, str):
+            center_match = _CENTER_PAIR_RE.fullmatch(center_value)
+            if center_match is not None:
+                chroma_center = (float(center_match[1]), float(center_match[2]))
+
+        anamorphic_data = _rename_aliases(post_data.get("anamorphic", {}), _ANAMORPHIC_ALIASES)
 
         post = PostConfig(
             bloom=BloomConfig(
-                threshold=float(bloom_data.get("threshold", 0.75)),
+                threshold=_f(bloom_data.get("threshold", 0.75)),
                 sigmas=bloom_sigmas,
                 intensities=bloom_intensities,
             ),
             chromatic_aberration=ChromaticAberrationConfig(
-                pixels=float(chroma_data.get("pixels", chroma_data.get("k", 1.2))),
+                pixels=_f(chroma_data.get("pixels", 1.2)),
                 center=chroma_center,
             ),
             anamorphic=AnamorphicConfig(
-                enabled=bool(anamorphic_data.get("enabled", True)),
-                length_px=float(anamorphic_data.get("length_px", anamorphic_data.get("length", 80.0))),
-                intensity=float(anamorphic_data.get("intensity", 0.15)),
+                length_px=_f(anamorphic_data.get("length_px", 80.0)),
+                **_coerce(anamorphic_data, _ANAMORPHIC_SCHEMA),
             ),
-            vignette=float(post_data.get("vignette", 0.25)),
-            grain=float(post_data.get("grain", 0.03)),
-            tonemap=str(post_data.get("tonemap", "filmic")),
-            gamma=float(post_data.get("gamma", 2.2)),
+            **_coerce(post_data, _POST_SCHEMA),
         )
 
         hud_data = data.get("hud", {})
         if not isinstance(hud_data, dict):
             hud_data = {}
-        hud_readouts: List[HUDReadout] = []
+        hud_data = _rename_aliases(hud_data, _HUD_ALIASES)
         explicit_readouts = "readouts" in hud_data
-        for item in hud_data.get("readouts", []):
-            if not isinstance(item, dict):
-                continue
-            text_value = str(item.get("text", "")).strip()
-            if not text_value:
-                continue
-            position_raw = item.get("position", item.get("x", item.get("u", 0.5)))
-            try:
-                position = float(position_raw)
-            except (TypeError, ValueError):
-                position = 0.5
-            position = max(0.0, min(1.0, position))
-            alignment_raw = str(item.get("alignment", "center")).lower()
-            alignment = {
-                "center": "center",
-                "middle": "center",
-                "start": "start",
-                "left": "start",
-                "end": "end",
-                "right": "end",
-            }.get(alignment_raw, "center")
-            hud_readouts.append(
-                HUDReadout(text=text_value, position=position, alignment=alignment)
-            )
+        hud_readouts = [
+            readout
+            for readout in map(_build_hud_readout, hud_data.get("readouts", []))
+            if readout is not None
+        ]
 
         enabled_raw = hud_data.get("enabled")
         if enabled_raw is None:
@@ -622,14 +910,14 @@ class SceneConfig:
 
         hud = HUDConfig(
             enabled=enabled,
-            height_px=int(hud_data.get("height_px", hud_data.get("height", 180))),
+            height_px=_i(hud_data.get("height_px", 180)),
             font=hud_data.get("font"),
-            emissive=float(hud_data.get("emissive", 1.3)),
+            emissive=_f(hud_data.get("emissive", 1.3)),
             readouts=tuple(hud_readouts),
             use_default_readouts=not explicit_readouts,
         )
 
-        seed = int(data.get("seed", 1))
+        seed = _i(data.get("seed", 1))
         name = data.get("name")
         lut = data.get("lut") or data.get("post", {}).get("lut")
 
@@ -637,8 +925,8 @@ class SceneConfig:
             seed=seed,
             resolution=resolution,
             camera=camera,
-            rings=rings,
-            readouts=readouts,
+            rings=tuple(rings),
+            readouts=tuple(readouts),
             stars=stars,
             text=text,
             post=post,
@@ -647,6 +935,40 @@ class SceneConfig:
             name=name,
         )
 
+    @classmethod
+    def from_dict_cached(
+        cls, data: Dict[str, Any], *, base_path: Optional[Path] = None
+    ) -> "SceneConfig":
+        """Like :meth:`from_dict`, reusing the result for identical input mappings.
+
+        Entries are keyed by a digest of the canonical JSON form of ``data``, so
+        equal dictionaries share one (read-only) :class:`SceneConfig`. Input
+        that JSON cannot represent exactly (non-string or mixed-type keys,
+        tuples, other non-JSON values) is parsed with :meth:`from_dict` and
+        not cached, so distinct inputs never share an entry.
+        """
+
+        try:
+            canonical = json.dumps(data, sort_keys=True)
+        except (TypeError, ValueError):
+            return cls.from_dict(data, base_path=base_path)
+        if json.loads(canonical) != data:
+            return cls.from_dict(data, base_path=base_path)
+        key = (
+            cls,
+            hashlib.blake2b(canonical.encode("utf8"), digest_size=16).digest(),
+            str(base_path) if base_path is not None else None,
+        )
+        cached = _FROM_DICT_CACHE.get(key)
+        if cached is not None:
+            _FROM_DICT_CACHE.move_to_end(key)
+            return cached
+        config = cls.from_dict(data, base_path=base_path)
+        _FROM_DICT_CACHE[key] = config
+        if len(_FROM_DICT_CACHE) > _FROM_DICT_CACHE_SIZE:
+            _FROM_DICT_CACHE.popitem(last=False)
+        return config
+
     def with_quality(self, preset: QualityPreset | str) -> "SceneConfig":
         """Return a copy of the configuration adjusted to a quality preset."""
 
@@ -752,129 +1074,131 @@ class SceneConfig:
 
     @classmethod
     def load(cls, path: Path) -> "SceneConfig":
-        """Load configuration from a YAML file."""
-        text = Path(path).read_text(encoding="utf8")
-        data = _load_yaml(text)
-        if not isinstance(data, dict):
-            raise ValueError("Configuration root must be a mapping")
-        return cls.from_dict(data, base_path=Path(path).parent)
+        """Load configuration from a YAML, JSON (``.json``) or TOML (``.toml``) file.
 
+        Parsed files are cached per absolute path until their modification
+        time or size changes, so relative and absolute spellings share one
+        entry. The size also catches rewrites that land within the
+        filesystem's timestamp granularity.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        return _load_cached(cls, str(path), stat.st_mtime_ns, stat.st_size)
 
-def _load_yaml(text: str) -> Any:
-    if yaml is not None:  # pragma: no cover - exercised when PyYAML is available
-        return yaml.safe_load(text)
-    return _simple_yaml_load(text)
 
+_FROM_DICT_CACHE_SIZE = 64
+_FROM_DICT_CACHE: "OrderedDict[Tuple[type, bytes, Optional[str]], SceneConfig]" = OrderedDict()
 
-def _simple_yaml_load(text: str) -> Any:
-    lines = []
-    for raw in text.splitlines():
-        stripped = raw.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        indent = len(raw) - len(raw.lstrip(" "))
-        lines.append((indent, stripped))
-    value, _ = _parse_block(lines, 0, 0)
-    return value
-
-
-def _parse_block(lines: List[Tuple[int, str]], index: int, indent: int) -> Tuple[Any, int]:
-    if index >= len(lines):
-        return {}, index
-    level, content = lines[index]
-    if content.startswith("- ") and level == indent:
-        return _parse_list(lines, index, indent)
-    result: Dict[str, Any] = {}
-    while index < len(lines):
-        level, content = lines[index]
-        if level < indent or content.startswith("- "):
-            break
-        if ":" not in content:
-            index += 1
-            continue
-        key, remainder = content.split(":", 1)
-        key = key.strip()
-        remainder = remainder.strip()
-        index += 1
-        if remainder:
-            result[key] = _parse_scalar(remainder)
-        else:
-            value, index = _parse_block(lines, index, indent + 2)
-            result[key] = value
-    return result, index
-
-
-def _parse_list(lines: List[Tuple[int, str]], index: int, indent: int) -> Tuple[List[Any], int]:
-    items: List[Any] = []
-    while index < len(lines):
-        level, content = lines[index]
-        if level < indent or not content.startswith("- "):
-            break
-        remainder = content[2:].strip()
-        index += 1
-        if remainder:
-            if ":" in remainder:
-                key, value_part = remainder.split(":", 1)
-                key = key.strip()
-                value_part = value_part.strip()
-                item: Dict[str, Any] = {}
-                item[key] = _parse_scalar(value_part) if value_part else None
-                if value_part == "":
-                    subvalue, index = _parse_block(lines, index, indent + 2)
-                    item[key] = subvalue
-                else:
-                    subvalue, index = _parse_block(lines, index, indent + 2)
-                    if isinstance(subvalue, dict):
-                        item.update(subvalue)
-                items.append(item)
-            else:
-                items.append(_parse_scalar(remainder))
-        else:
-            value, index = _parse_block(lines, index, indent + 2)
-            items.append(value)
-    return items, index
-
-
-def _parse_scalar(token: str) -> Any:
-    if token.startswith("\"") and token.endswith("\""):
-        return token[1:-1]
-    if token.startswith("'") and token.endswith("'"):
-        return token[1:-1]
-    lowered = token.lower()
-    if lowered == "true":
-        return True
-    if lowered == "false":
-        return False
-    if lowered == "null":
-        return None
-    if token.startswith("[") or token.startswith("{"):
-        return ast.literal_eval(token)
+
+@lru_cache(maxsize=32)
+def _load_cached(cls: type, path: str, mtime_ns: int, size: int) -> SceneConfig:
+    data = _read_config_data(Path(path), (mtime_ns, size))
+    if not isinstance(data, dict):
+        raise ValueError("Configuration root must be a mapping")
+    return cls.from_dict(data, base_path=Path(path).parent)
+
+
+_CONFIG_CACHE_DIR_ENV = "STAR_CHART_CACHE_DIR"
+
+
+def _config_cache_dir() -> Path:
+    """Return the directory holding parsed-YAML caches.
+
+    ``$STAR_CHART_CACHE_DIR`` wins, then ``$XDG_CACHE_HOME``, then
+    ``~/.cache``. Caches never go next to the configs, so writing one does not
+    touch a directory the web interface lists.
+    """
+
+    override = os.environ.get(_CONFIG_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "star_chart_generator"
+
+
+def _read_config_data(path: Path, stamp: Tuple[int, int]) -> Any:
+    """Return the parsed scene document at ``path``.
+
+    ``.json`` and ``.toml`` files go straight to the standard library parsers.
+    For YAML, the parsed data is mirrored to a JSON file in
+    :func:`_config_cache_dir`, named after a hash of the absolute path and
+    stored with the source's ``(mtime_ns, size)`` ``stamp``; it is read instead
+    of the YAML while that stamp still matches. Documents that do not survive
+    a JSON round trip unchanged (non-string keys, dates, sets) are not cached,
+    and cache failures such as an unwritable directory only cost the speedup.
+    """
+
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        with open(path, "r", encoding="utf8") as handle:
+            return json.load(handle)
+    if suffix == ".toml":
+        if tomllib is None:
+            raise ValueError("TOML scene files require Python 3.11 or newer")
+        with open(path, "rb") as handle:
+            return tomllib.load(handle)
+
+    cache_dir = _config_cache_dir()
+    cache_path = cache_dir / (hashlib.sha1(str(path).encode("utf8")).hexdigest() + ".json")
     try:
-        if token.startswith("0x"):
-            return int(token, 16)
-        return int(token)
-    except ValueError:
+        with open(cache_path, "r", encoding="utf8") as handle:
+            cached = json.load(handle)
+        if cached["source"] == list(stamp):
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
         pass
+
+    data = _load_yaml(path.read_text(encoding="utf8"))
     try:
-        return float(token)
-    except ValueError:
+        payload = json.dumps({"source": list(stamp), "data": data})
+        if json.loads(payload)["data"] != data:
+            return data
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=cache_path.name, suffix=".tmp", dir=str(cache_dir))
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as handle:
+                handle.write(payload)
+            os.replace(temp_name, cache_path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except (OSError, TypeError, ValueError):
         pass
-    return token
+    return data
+
+
+# Bound once at import so each load is a single call. The built-in parser in
+# :mod:`.simple_yaml` is a slow fallback for environments without PyYAML and is
+# only imported on first use; install PyYAML or use JSON/TOML scenes when load
+# time matters.
+if yaml is not None:  # pragma: no cover - exercised when PyYAML is available
+    _load_yaml: Callable[[str], Any] = partial(yaml.load, Loader=_YamlLoader)
+else:
+
+    def _load_yaml(text: str) -> Any:
+        from .simple_yaml import load
+
+        return load(text)
 
 
 __all__ = [
     "QualityPreset",
     "Resolution",
     "Camera",
+    "RingTickConfig",
     "RingConfig",
+    "RingArrays",
     "ReadoutPlacement",
     "ReadoutConfig",
-    "CoreDistribution",
-    "HaloDistribution",
+    "BulgeDistribution",
+    "BackgroundDistribution",
     "StarConfig",
     "TextConfig",
+    "HUDReadout",
+    "HUDConfig",
     "BloomConfig",
     "ChromaticAberrationConfig",
+    "AnamorphicConfig",
     "PostConfig",
     "SceneConfig",
 ]
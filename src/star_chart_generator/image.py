@@ -1,17 +1,43 @@
 """Minimal float RGB image utilities with PNG serialization."""
 from __future__ import annotations
 
+import gc
 import math
 import struct
 import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from itertools import accumulate, chain, repeat
+from operator import add, mul, sub
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 Color = Tuple[float, float, float]
 
+_BYTE_TO_FLOAT: Tuple[float, ...] = tuple(value / 255.0 for value in range(256))
 
-@dataclass
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector while pixel storage is built.
+
+    A frame is millions of small float lists, which cannot form reference
+    cycles, yet allocating them keeps tripping collections that rescan every
+    live object. Those scans cost several times the allocation itself.
+    """
+
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@dataclass(slots=True)
 class FloatImage:
     width: int
     height: int
@@ -19,15 +45,29 @@ class FloatImage:
 
     @classmethod
     def new(cls, width: int, height: int, fill: float = 0.0) -> "FloatImage":
-        rows = [[[fill, fill, fill] for _ in range(width)] for _ in range(height)]
+        with _gc_paused():
+            rows = [[[fill, fill, fill] for _ in range(width)] for _ in range(height)]
+        return cls(width=width, height=height, pixels=rows)
+
+    @classmethod
+    def from_rgb_bytes(cls, width: int, height: int, data: bytes) -> "FloatImage":
+        """Build an image from packed 8-bit RGB scanlines without filter bytes."""
+
+        stride = width * 3
+        if len(data) < stride * height:
+            raise ValueError("Not enough pixel data for the requested dimensions")
+        lookup = _BYTE_TO_FLOAT.__getitem__
+        rows: List[List[List[float]]] = []
+        with _gc_paused():
+            for y in range(height):
+                values = list(map(lookup, data[y * stride : (y + 1) * stride]))
+                rows.append([values[x : x + 3] for x in range(0, stride, 3)])
         return cls(width=width, height=height, pixels=rows)
 
     def copy(self) -> "FloatImage":
-        return FloatImage(
-            width=self.width,
-            height=self.height,
-            pixels=[[pixel[:] for pixel in row] for row in self.pixels],
-        )
+        with _gc_paused():
+            pixels = [[pixel[:] for pixel in row] for row in self.pixels]
+        return FloatImage(width=self.width, height=self.height, pixels=pixels)
 
     def add_pixel(self, x: int, y: int, color: Color, intensity: float = 1.0) -> None:
         if 0 <= x < self.width and 0 <= y < self.height:
@@ -41,64 +81,136 @@ class FloatImage:
         return (pixel[0], pixel[1], pixel[2])
 
     def add_gaussian(self, cx: float, cy: float, sigma: float, intensity: float, color: Color) -> None:
-        if sigma <= 0:
-            return
-        radius = max(1, int(sigma * 3.0))
-        x0 = max(0, int(cx) - radius)
-        x1 = min(self.width, int(cx) + radius + 1)
-        y0 = max(0, int(cy) - radius)
-        y1 = min(self.height, int(cy) + radius + 1)
-        two_sigma_sq = 2.0 * sigma * sigma
-        for y in range(y0, y1):
-            dy = y - cy
-            for x in range(x0, x1):
-                dx = x - cx
-                value = math.exp(-(dx * dx + dy * dy) / two_sigma_sq)
-                self.add_pixel(x, y, color, intensity * value)
+        self.add_gaussians((cx,), (cy,), (sigma,), (intensity,), (color,))
+
+    def add_gaussians(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        sigmas: Iterable[float],
+        intensities: Sequence[float],
+        colors: Sequence[Color],
+    ) -> None:
+        """Splat many Gaussians in one call, as :meth:`add_gaussian` would.
+
+        Splats are independent, so the loop binds the image state and
+        ``math.exp`` once for the whole batch instead of once per splat.
+        The batch runs on one thread on purpose: the loop holds the GIL
+        throughout, and splitting it across processes would cost more in
+        pickling the frame than the splats take. Overlapping splats are
+        summed in input order, which keeps renders reproducible.
+        """
+
+        exp = math.exp
+        pixels = self.pixels
+        width = self.width
+        height = self.height
+        for cx, cy, sigma, intensity, (red, green, blue) in zip(
+            xs, ys, sigmas, intensities, colors
+        ):
+            if sigma <= 0:
+                continue
+            radius = max(1, int(sigma * 3.0))
+            x0 = max(0, int(cx) - radius)
+            x1 = min(width, int(cx) + radius + 1)
+            y0 = max(0, int(cy) - radius)
+            y1 = min(height, int(cy) + radius + 1)
+            two_sigma_sq = 2.0 * sigma * sigma
+            # The 2D Gaussian is separable: exp(-(dx² + dy²) / 2σ²) is the
+            # product of a row and a column weight, so only 2·(2r+1) exps are
+            # needed. The window is already clipped to the image, so weights
+            # accumulate straight into the pixel lists.
+            column_weights = [exp(-((x - cx) ** 2) / two_sigma_sq) for x in range(x0, x1)]
+            for y in range(y0, y1):
+                row_weight = intensity * exp(-((y - cy) ** 2) / two_sigma_sq)
+                for pixel, weight in zip(pixels[y][x0:x1], column_weights):
+                    value = row_weight * weight
+                    pixel[0] += red * value
+                    pixel[1] += green * value
+                    pixel[2] += blue * value
 
     def add_disc(self, cx: float, cy: float, radius: float, color: Color, intensity: float = 1.0) -> None:
-        r2 = radius * radius
-        x0 = max(0, int(cx - radius - 1))
-        x1 = min(self.width, int(cx + radius + 2))
-        y0 = max(0, int(cy - radius - 1))
-        y1 = min(self.height, int(cy + radius + 2))
-        for y in range(y0, y1):
-            dy = y - cy
-            for x in range(x0, x1):
-                dx = x - cx
-                if dx * dx + dy * dy <= r2:
-                    self.add_pixel(x, y, color, intensity)
+        _stamp_disc(
+            self.pixels,
+            self.width,
+            self.height,
+            cx,
+            cy,
+            radius,
+            color[0] * intensity,
+            color[1] * intensity,
+            color[2] * intensity,
+        )
+
+    def add_discs(
+        self,
+        centers: Iterable[Tuple[float, float]],
+        radius: float,
+        color: Color,
+        intensity: float = 1.0,
+    ) -> None:
+        """Stamp equal discs at each of ``centers``, as :meth:`add_disc` would."""
+
+        pixels = self.pixels
+        width = self.width
+        height = self.height
+        red = color[0] * intensity
+        green = color[1] * intensity
+        blue = color[2] * intensity
+        for cx, cy in centers:
+            _stamp_disc(pixels, width, height, cx, cy, radius, red, green, blue)
 
     def add_line(self, p0: Tuple[float, float], p1: Tuple[float, float], color: Color, width: int = 1, intensity: float = 1.0) -> None:
-        x0, y0 = p0
-        x1, y1 = p1
-        dx = x1 - x0
-        dy = y1 - y0
-        length = max(abs(dx), abs(dy))
-        if length == 0:
-            self.add_disc(x0, y0, width * 0.5, color, intensity)
-            return
-        steps = int(length) + 1
-        for i in range(steps + 1):
-            t = i / max(steps, 1)
-            x = x0 + dx * t
-            y = y0 + dy * t
-            self.add_disc(x, y, max(0.5, width * 0.5), color, intensity)
-
-    def apply_map(self, func) -> None:
-        for y in range(self.height):
-            row = self.pixels[y]
-            for x in range(self.width):
-                r, g, b = row[x]
-                row[x][0], row[x][1], row[x][2] = func(r, g, b)
+        self.add_lines(((p0[0], p0[1], p1[0], p1[1]),), color, (width,), (intensity,))
+
+    def add_lines(
+        self,
+        lines: Iterable[Tuple[float, float, float, float]],
+        color: Color,
+        widths: Iterable[int],
+        intensities: Iterable[float],
+    ) -> None:
+        """Draw ``(x0, y0, x1, y1)`` segments of one colour, as :meth:`add_line` would.
+
+        Tick marks come in batches of dozens per ring; stamping them in one
+        call keeps the image state bound for the whole batch.
+        """
+
+        pixels = self.pixels
+        width_px = self.width
+        height_px = self.height
+        red, green, blue = color
+        for (x0, y0, x1, y1), width, intensity in zip(lines, widths, intensities):
+            r = red * intensity
+            g = green * intensity
+            b = blue * intensity
+            dx = x1 - x0
+            dy = y1 - y0
+            length = max(abs(dx), abs(dy))
+            if length == 0:
+                _stamp_disc(pixels, width_px, height_px, x0, y0, width * 0.5, r, g, b)
+                continue
+            steps = int(length) + 1
+            radius = max(0.5, width * 0.5)
+            for i in range(steps + 1):
+                t = i / steps
+                _stamp_disc(pixels, width_px, height_px, x0 + dx * t, y0 + dy * t, radius, r, g, b)
+
+    def apply_map(self, func: Callable[[float, float, float], Sequence[float]]) -> None:
+        """Replace every pixel with ``func(r, g, b)``, updating the lists in place."""
+
+        for row in self.pixels:
+            for pixel in row:
+                pixel[:] = func(*pixel)
 
     def multiply(self, factor: float) -> None:
-        for y in range(self.height):
-            row = self.pixels[y]
-            for x in range(self.width):
-                row[x][0] *= factor
-                row[x][1] *= factor
-                row[x][2] *= factor
+        if factor == 1.0:
+            return
+        for row in self.pixels:
+            for pixel in row:
+                pixel[0] *= factor
+                pixel[1] *= factor
+                pixel[2] *= factor
 
     def add_image(self, other: "FloatImage") -> None:
         for row, other_row in zip(self.pixels, other.pixels):
@@ -115,73 +227,94 @@ class FloatImage:
                 pixel[2] += other_pixel[2] * scale
 
     def clamp(self, lo: float = 0.0, hi: float = 1.0) -> None:
-        for y in range(self.height):
-            for x in range(self.width):
-                pixel = self.pixels[y][x]
-                pixel[0] = min(max(pixel[0], lo), hi)
-                pixel[1] = min(max(pixel[1], lo), hi)
-                pixel[2] = min(max(pixel[2], lo), hi)
+        for row in self.pixels:
+            for pixel in row:
+                r, g, b = pixel
+                pixel[0] = lo if r < lo else hi if r > hi else r
+                pixel[1] = lo if g < lo else hi if g > hi else g
+                pixel[2] = lo if b < lo else hi if b > hi else b
 
     def downsample(self, factor: int) -> "FloatImage":
+        """Area-average ``factor`` x ``factor`` blocks into single pixels.
+
+        Each output row reduces over a slice of ``factor`` source rows, and the
+        output pixels are built directly instead of zero-filled and rewritten.
+        """
+
         if factor <= 1:
             return self.copy()
         new_width = self.width // factor
         new_height = self.height // factor
-        output = FloatImage.new(new_width, new_height, 0.0)
-        for y in range(new_height):
-            for x in range(new_width):
-                acc = [0.0, 0.0, 0.0]
-                for yy in range(factor):
-                    for xx in range(factor):
-                        pixel = self.pixels[y * factor + yy][x * factor + xx]
-                        acc[0] += pixel[0]
-                        acc[1] += pixel[1]
-                        acc[2] += pixel[2]
-                scale = 1.0 / (factor * factor)
-                output.pixels[y][x][0] = acc[0] * scale
-                output.pixels[y][x][1] = acc[1] * scale
-                output.pixels[y][x][2] = acc[2] * scale
-        return output
+        scale = 1.0 / (factor * factor)
+        pixels = self.pixels
+        rows: List[List[List[float]]] = []
+        with _gc_paused():
+            for y in range(new_height):
+                block = pixels[y * factor : (y + 1) * factor]
+                row = []
+                for x0 in range(0, new_width * factor, factor):
+                    acc0 = acc1 = acc2 = 0.0
+                    for src_row in block:
+                        for pixel in src_row[x0 : x0 + factor]:
+                            acc0 += pixel[0]
+                            acc1 += pixel[1]
+                            acc2 += pixel[2]
+                    row.append([acc0 * scale, acc1 * scale, acc2 * scale])
+                rows.append(row)
+        return FloatImage(width=new_width, height=new_height, pixels=rows)
 
     def to_uint8_rows(self) -> List[bytearray]:
+        """Return PNG scanlines: a filter byte of 0 followed by clamped RGB bytes.
+
+        Each row is quantised in one comprehension over its flattened
+        channels, with the clamp written as comparisons rather than
+        ``min``/``max`` calls.
+        """
+
         rows: List[bytearray] = []
-        for y in range(self.height):
-            row_bytes = bytearray()
-            row_bytes.append(0)  # filter type 0
-            for x in range(self.width):
-                r, g, b = self.pixels[y][x]
-                row_bytes.append(int(min(max(r, 0.0), 1.0) * 255.0 + 0.5))
-                row_bytes.append(int(min(max(g, 0.0), 1.0) * 255.0 + 0.5))
-                row_bytes.append(int(min(max(b, 0.0), 1.0) * 255.0 + 0.5))
+        flatten = chain.from_iterable
+        for row in self.pixels:
+            row_bytes = bytearray(1)  # filter type 0
+            row_bytes.extend(
+                [
+                    0 if value <= 0.0 else 255 if value >= 1.0 else int(value * 255.0 + 0.5)
+                    for value in flatten(row)
+                ]
+            )
             rows.append(row_bytes)
         return rows
 
-    def to_png_bytes(self) -> bytes:
-        """Return the image encoded as PNG bytes."""
+    def to_png_bytes(self, compress_level: int = 6) -> bytes:
+        """Return the image encoded as PNG bytes.
+
+        ``compress_level`` is the zlib level (0-9); low levels trade file size
+        for a much faster encode, which suits interactive previews.
+        """
 
-        rows = self.to_uint8_rows()
-        data = b"".join(rows)
-        compressed = zlib.compress(data, level=6)
+        # Rows stream through one compressor, so the raw scanlines are never
+        # joined into a second full-size buffer; the bytes match zlib.compress.
+        compressor = zlib.compressobj(compress_level)
+        compressed = b"".join([*map(compressor.compress, self.to_uint8_rows()), compressor.flush()])
 
         def chunk(tag: bytes, payload: bytes) -> bytes:
-            return (
-                struct.pack(">I", len(payload))
-                + tag
-                + payload
-                + struct.pack(">I", zlib.crc32(tag + payload) & 0xFFFFFFFF)
-            )
+            # The CRC runs over the tag and then the payload, so the (large)
+            # IDAT payload is never concatenated just to be checksummed.
+            crc = zlib.crc32(payload, zlib.crc32(tag))
+            return b"".join((struct.pack(">I", len(payload)), tag, payload, struct.pack(">I", crc)))
 
         ihdr = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
-        png_bytes = bytearray()
-        png_bytes.extend(b"\x89PNG\r\n\x1a\n")
-        png_bytes.extend(chunk(b"IHDR", ihdr))
-        png_bytes.extend(chunk(b"IDAT", compressed))
-        png_bytes.extend(chunk(b"IEND", b""))
-        return bytes(png_bytes)
-
-    def save_png(self, path: str) -> None:
+        return b"".join(
+            (
+                b"\x89PNG\r\n\x1a\n",
+                chunk(b"IHDR", ihdr),
+                chunk(b"IDAT", compressed),
+                chunk(b"IEND", b""),
+            )
+        )
+
+    def save_png(self, path: str, compress_level: int = 6) -> None:
         with open(path, "wb") as fh:
-            fh.write(self.to_png_bytes())
+            fh.write(self.to_png_bytes(compress_level))
 
     def sample(self, x: float, y: float) -> Color:
         if x < 0 or x >= self.width - 1 or y < 0 or y >= self.height - 1:
@@ -199,86 +332,268 @@ class FloatImage:
         p01 = self.pixels[y0][x1]
         p10 = self.pixels[y1][x0]
         p11 = self.pixels[y1][x1]
-        top = [p00[c] * (1 - wx) + p01[c] * wx for c in range(3)]
-        bottom = [p10[c] * (1 - wx) + p11[c] * wx for c in range(3)]
-        return tuple(top[c] * (1 - wy) + bottom[c] * wy for c in range(3))
-
-
-def gaussian_blur(image: FloatImage, sigma: float) -> FloatImage:
-    if sigma <= 0:
-        return image.copy()
+        ix = 1 - wx
+        iy = 1 - wy
+        return (
+            (p00[0] * ix + p01[0] * wx) * iy + (p10[0] * ix + p11[0] * wx) * wy,
+            (p00[1] * ix + p01[1] * wx) * iy + (p10[1] * ix + p11[1] * wx) * wy,
+            (p00[2] * ix + p01[2] * wx) * iy + (p10[2] * ix + p11[2] * wx) * wy,
+        )
 
-    kernel, radius = gaussian_kernel(sigma)
-    width, height = image.width, image.height
+    def sample_channel(self, x: float, y: float, channel: int) -> float:
+        """Bilinearly sample a single channel; equal to ``sample(x, y)[channel]``."""
 
-    temp = FloatImage.new(width, height, 0.0)
-    source_pixels = image.pixels
-    temp_pixels = temp.pixels
-    for y in range(height):
-        src_row = source_pixels[y]
-        dst_row = temp_pixels[y]
-        for x in range(width):
-            acc0 = acc1 = acc2 = 0.0
-            start = x - radius
+        if x < 0 or x >= self.width - 1 or y < 0 or y >= self.height - 1:
+            ix = min(max(int(x), 0), self.width - 1)
+            iy = min(max(int(y), 0), self.height - 1)
+            return self.pixels[iy][ix][channel]
+        # Both coordinates are non-negative here, so truncation is floor.
+        x0 = int(x)
+        y0 = int(y)
+        wx = x - x0
+        wy = y - y0
+        row0 = self.pixels[y0]
+        row1 = self.pixels[y0 + 1]
+        top = row0[x0][channel] * (1 - wx) + row0[x0 + 1][channel] * wx
+        bottom = row1[x0][channel] * (1 - wx) + row1[x0 + 1][channel] * wx
+        return top * (1 - wy) + bottom * wy
+
+
+def _stamp_disc(
+    pixels: List[List[List[float]]],
+    width: int,
+    height: int,
+    cx: float,
+    cy: float,
+    radius: float,
+    red: float,
+    green: float,
+    blue: float,
+) -> None:
+    # The window is clipped to the image, so no per-pixel bounds check. Column
+    # offsets are computed once per disc, and rows whose vertical offset alone
+    # exceeds the radius are skipped without visiting their pixels.
+    r2 = radius * radius
+    x0 = max(0, int(cx - radius - 1))
+    x1 = min(width, int(cx + radius + 2))
+    y0 = max(0, int(cy - radius - 1))
+    y1 = min(height, int(cy + radius + 2))
+    offsets = [x - cx for x in range(x0, x1)]
+    for y in range(y0, y1):
+        dy = y - cy
+        dy2 = dy * dy
+        if dy2 > r2:
+            continue
+        for dx, pixel in zip(offsets, pixels[y][x0:x1]):
+            if dx * dx + dy2 <= r2:
+                pixel[0] += red
+                pixel[1] += green
+                pixel[2] += blue
+
+
+def _scatter_rows(
+    rows: List[List[List[float]]], width: int, kernel: Sequence[float], radius: int
+) -> Tuple[List[List[List[float]]], List[Optional[Tuple[int, int]]]]:
+    """Convolve every row with ``kernel``, scattering only non-zero pixels.
+
+    Returns the blurred rows and, per row, the ``(start, end)`` span that any
+    weight was written to, or ``None`` when the row stayed black. Sums build
+    up in ascending source order, exactly as a gathering convolution would.
+    """
+
+    with _gc_paused():
+        output = [[[0.0, 0.0, 0.0] for _ in range(width)] for _ in rows]
+    spans: List[Optional[Tuple[int, int]]] = []
+    for src_row, dst_row in zip(rows, output):
+        first = last = -1
+        for xx, pixel in enumerate(src_row):
+            v0, v1, v2 = pixel
+            if not (v0 or v1 or v2):
+                continue
+            start = xx - radius
             kernel_index = 0
             if start < 0:
                 kernel_index = -start
                 start = 0
-            end = x + radius + 1
+            end = xx + radius + 1
             if end > width:
                 end = width
-            for xx in range(start, end):
+            if first < 0:
+                first = start
+            last = end
+            for x in range(start, end):
                 weight = kernel[kernel_index]
-                pixel = src_row[xx]
-                acc0 += pixel[0] * weight
-                acc1 += pixel[1] * weight
-                acc2 += pixel[2] * weight
+                dst_pixel = dst_row[x]
+                dst_pixel[0] += v0 * weight
+                dst_pixel[1] += v1 * weight
+                dst_pixel[2] += v2 * weight
                 kernel_index += 1
-            dst_pixel = dst_row[x]
-            dst_pixel[0] = acc0
-            dst_pixel[1] = acc1
-            dst_pixel[2] = acc2
+        spans.append((first, last) if first >= 0 else None)
+    return output, spans
+
+
+# Above this sigma gaussian_blur switches to a cascade of box filters. Its
+# cost no longer grows with the radius; below it the sparse scatter is faster.
+_BOX_CASCADE_MIN_SIGMA = 8.0
+
+
+def _box_sizes(sigma: float, passes: int = 3) -> List[int]:
+    """Return odd box widths whose cascade has roughly the variance ``sigma**2``."""
+
+    ideal = math.sqrt(12.0 * sigma * sigma / passes + 1.0)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    split = round(
+        (12.0 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes)
+        / (-4 * lower - 4)
+    )
+    return [lower if index < split else upper for index in range(passes)]
+
+
+def _box_blur_cascade(image: FloatImage, sigma: float) -> FloatImage:
+    """Approximate a Gaussian blur with three box filters per axis.
+
+    Every box pass is a running sum, so the cost is independent of ``sigma``.
+    Rows are split into per-channel lists and swept with ``accumulate`` and
+    ``map`` so the sums run in C; black rows are tracked as ``None``.
+    """
+
+    width, height = image.width, image.height
+    sizes = _box_sizes(sigma)
+    planes: List[List[Optional[List[float]]]] = [[], [], []]
+    for row in image.pixels:
+        flat = list(chain.from_iterable(row))
+        lit = any(flat)
+        for channel, plane in enumerate(planes):
+            plane.append(flat[channel::3] if lit else None)
+
+    for size in sizes:
+        pad = [0.0] * ((size - 1) // 2)
+        inv = 1.0 / size
+        for plane in planes:
+            for y, values in enumerate(plane):
+                if values is None:
+                    continue
+                sums = list(accumulate(pad + values + pad, initial=0.0))
+                plane[y] = list(map(mul, map(sub, sums[size:], sums[:width]), repeat(inv)))
+
+    for size in sizes:
+        radius = (size - 1) // 2
+        inv = 1.0 / size
+        for channel, plane in enumerate(planes):
+            window = [0.0] * width
+            live = False
+            for values in plane[:radius]:
+                if values is not None:
+                    window = list(map(add, window, values))
+                    live = True
+            blurred: List[Optional[List[float]]] = []
+            for y in range(height):
+                entering = y + radius
+                if entering < height and plane[entering] is not None:
+                    window = list(map(add, window, plane[entering]))
+                    live = True
+                blurred.append(list(map(mul, window, repeat(inv))) if live else None)
+                leaving = y - radius
+                if leaving >= 0 and plane[leaving] is not None:
+                    window = list(map(sub, window, plane[leaving]))
+            planes[channel] = blurred
+
+    black = [0.0] * width
+    with _gc_paused():
+        pixels = [
+            list(map(list, zip(red or black, green or black, blue or black)))
+            for red, green, blue in zip(*planes)
+        ]
+    return FloatImage(width=width, height=height, pixels=pixels)
+
+
+def gaussian_blur(image: FloatImage, sigma: float) -> FloatImage:
+    """Return ``image`` blurred by a separable Gaussian of width ``sigma``.
+
+    Both passes scatter each non-zero pixel into its neighbourhood instead of
+    gathering a full window for every output pixel. Glow and bloom layers are
+    mostly black, so the cost follows the lit area rather than ``W * H * sigma``
+    and large radii stay affordable. The vertical pass only scans the spans the
+    horizontal pass wrote to. Beyond ``_BOX_CASCADE_MIN_SIGMA`` a box-filter
+    cascade approximates the Gaussian at a cost independent of ``sigma``.
+    """
+
+    if sigma <= 0:
+        return image.copy()
+    if sigma > _BOX_CASCADE_MIN_SIGMA:
+        return _box_blur_cascade(image, sigma)
+
+    kernel, radius = gaussian_kernel(sigma)
+    width, height = image.width, image.height
+    temp_pixels, spans = _scatter_rows(image.pixels, width, kernel, radius)
 
     output = FloatImage.new(width, height, 0.0)
     output_pixels = output.pixels
-    for y in range(height):
-        dst_row = output_pixels[y]
-        for x in range(width):
-            acc0 = acc1 = acc2 = 0.0
-            start = y - radius
-            kernel_index = 0
-            if start < 0:
-                kernel_index = -start
-                start = 0
-            end = y + radius + 1
-            if end > height:
-                end = height
-            for yy in range(start, end):
-                weight = kernel[kernel_index]
-                pixel = temp_pixels[yy][x]
-                acc0 += pixel[0] * weight
-                acc1 += pixel[1] * weight
-                acc2 += pixel[2] * weight
-                kernel_index += 1
-            dst_pixel = dst_row[x]
-            dst_pixel[0] = acc0
-            dst_pixel[1] = acc1
-            dst_pixel[2] = acc2
+    for yy, (src_row, span) in enumerate(zip(temp_pixels, spans)):
+        if span is None:
+            continue
+        lo, hi = span
+        lit = [
+            (x, pixel[0], pixel[1], pixel[2])
+            for x, pixel in enumerate(src_row[lo:hi], lo)
+            if pixel[0] or pixel[1] or pixel[2]
+        ]
+        if not lit:
+            continue
+        start = yy - radius
+        kernel_index = 0
+        if start < 0:
+            kernel_index = -start
+            start = 0
+        end = yy + radius + 1
+        if end > height:
+            end = height
+        for y in range(start, end):
+            weight = kernel[kernel_index]
+            dst_row = output_pixels[y]
+            for x, v0, v1, v2 in lit:
+                dst_pixel = dst_row[x]
+                dst_pixel[0] += v0 * weight
+                dst_pixel[1] += v1 * weight
+                dst_pixel[2] += v2 * weight
+            kernel_index += 1
 
     return output
 
 
-def gaussian_kernel(sigma: float) -> Tuple[List[float], int]:
+def horizontal_blur(image: FloatImage, sigma: float) -> FloatImage:
+    """Return ``image`` blurred along its rows only, e.g. for anamorphic streaks."""
+
+    if sigma <= 0:
+        return image.copy()
+    kernel, radius = gaussian_kernel(sigma)
+    rows, _ = _scatter_rows(image.pixels, image.width, kernel, radius)
+    return FloatImage(width=image.width, height=image.height, pixels=rows)
+
+
+@lru_cache(maxsize=64)
+def gaussian_kernel(sigma: float) -> Tuple[Tuple[float, ...], int]:
+    """Return the normalised 1D Gaussian kernel for ``sigma`` and its radius.
+
+    Kernels are cached: bloom levels, glows and repeated renders ask for the
+    same few sigmas, so the table is built once and shared as a tuple.
+    """
+
     if sigma <= 0:
-        return [1.0], 0
+        return (1.0,), 0
     radius = max(1, int(math.ceil(sigma * 3.0)))
     denom = 2.0 * sigma * sigma
-    kernel = [math.exp(-(offset * offset) / denom) for offset in range(-radius, radius + 1)]
+    # The kernel is symmetric, so evaluate one side and mirror it.
+    half = [math.exp(-(offset * offset) / denom) for offset in range(radius + 1)]
+    kernel = half[:0:-1] + half
     total = sum(kernel)
     if total <= 0.0:
-        return [1.0], 0
+        return (1.0,), 0
     inv_total = 1.0 / total
-    return [value * inv_total for value in kernel], radius
+    return tuple([value * inv_total for value in kernel]), radius
 
 
-__all__ = ["FloatImage", "gaussian_blur", "gaussian_kernel", "Color"]
+__all__ = ["FloatImage", "gaussian_blur", "gaussian_kernel", "horizontal_blur", "Color"]
@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import math
 
 from .config import TextConfig
 from .image import FloatImage
-from .utils import hex_to_rgb
 
 Glyph = List[str]
 
@@ -59,7 +59,7 @@ GLYPH_WIDTH = 5
 GLYPH_HEIGHT = 7
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelSpec:
     ring_index: int
     text: str
@@ -73,7 +73,7 @@ class LabelSpec:
     baseline: str = "arc"
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelPlacement:
     spec: LabelSpec
     theta: float
@@ -167,20 +167,45 @@ def layout_labels(
     return ordered
 
 
-def _draw_glyph(image: FloatImage, glyph: Glyph, center: Tuple[float, float], scale: float, rotation: float, color: Tuple[float, float, float], intensity: float) -> None:
-    cx, cy = center
+@lru_cache(maxsize=None)
+def _glyph_cells(char: str) -> Tuple[Tuple[float, float], ...]:
+    """Return the filled cells of ``char`` relative to the glyph centre."""
+
+    return tuple(
+        (x - GLYPH_WIDTH / 2.0, y - GLYPH_HEIGHT / 2.0)
+        for y, row in enumerate(_glyph(char))
+        for x, ch in enumerate(row)
+        if ch == "#"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _glyph_offsets(char: str, scale: float, rotation: float) -> Tuple[Tuple[float, float], ...]:
+    """Return the scaled and rotated dot offsets of ``char``.
+
+    Keyed on the exact scale and rotation, so re-rendering a scene (or a label
+    repeated at the same angle) reuses the transformed glyph.
+    """
+
     angle = math.radians(rotation)
     cos_a = math.cos(angle)
     sin_a = math.sin(angle)
-    for y, row in enumerate(glyph):
-        for x, ch in enumerate(row):
-            if ch != "#":
-                continue
-            px = (x - GLYPH_WIDTH / 2.0) * scale
-            py = (y - GLYPH_HEIGHT / 2.0) * scale
-            rx = px * cos_a - py * sin_a
-            ry = px * sin_a + py * cos_a
-            image.add_disc(cx + rx, cy + ry, max(0.5, scale * 0.45), color, intensity)
+    offsets = []
+    for x, y in _glyph_cells(char):
+        px = x * scale
+        py = y * scale
+        offsets.append((px * cos_a - py * sin_a, px * sin_a + py * cos_a))
+    return tuple(offsets)
+
+
+def _draw_glyph(image: FloatImage, char: str, center: Tuple[float, float], scale: float, rotation: float, color: Tuple[float, float, float], intensity: float) -> None:
+    cx, cy = center
+    image.add_discs(
+        [(cx + rx, cy + ry) for rx, ry in _glyph_offsets(char, scale, rotation)],
+        max(0.5, scale * 0.45),
+        color,
+        intensity,
+    )
 
 
 def draw_text_line(
@@ -217,9 +242,8 @@ def draw_text_line(
         cursor += (advance * scale) * 0.5
         px = cx + cursor * cos_a
         py = cy + cursor * sin_a
-        glyph = _glyph(char)
-        _draw_glyph(core, glyph, (px, py), scale, angle, color, 1.0)
-        _draw_glyph(glow, glyph, (px, py), scale * 1.6, angle, glow_color, emissive)
+        _draw_glyph(core, char, (px, py), scale, angle, color, 1.0)
+        _draw_glyph(glow, char, (px, py), scale * 1.6, angle, glow_color, emissive)
         cursor += (advance * scale) * 0.5
 
 
@@ -227,25 +251,35 @@ def draw_label_layers(
     size: Tuple[int, int],
     placements: Sequence[LabelPlacement],
     text_config: TextConfig,
+    core: Optional[FloatImage] = None,
 ) -> Tuple[FloatImage, FloatImage]:
+    """Draw placed labels into core and glow layers.
+
+    When ``core`` is given the glyph cores are accumulated straight into it,
+    saving a full-resolution intermediate buffer and the pass that merges it.
+    """
+
     width, height = size
-    core = FloatImage.new(width, height, 0.0)
+    if core is None:
+        core = FloatImage.new(width, height, 0.0)
     glow = FloatImage.new(width, height, 0.0)
-    base_color = hex_to_rgb(text_config.color)
+    base_color = text_config.rgb
     for placement in placements:
         spec = placement.spec
         scale = spec.scale
         total_advance = sum(placement.advances) * scale
         if spec.baseline.lower() == "linear":
             theta_center = placement.theta
-            cx = spec.center[0] + spec.radius_x * math.cos(theta_center)
-            cy = spec.center[1] + spec.radius_y * math.sin(theta_center)
-            tx = -spec.radius_x * math.sin(theta_center)
-            ty = spec.radius_y * math.cos(theta_center)
+            cos_t = math.cos(theta_center)
+            sin_t = math.sin(theta_center)
+            cx = spec.center[0] + spec.radius_x * cos_t
+            cy = spec.center[1] + spec.radius_y * sin_t
+            tx = -spec.radius_x * sin_t
+            ty = spec.radius_y * cos_t
             length = math.hypot(tx, ty)
             if length <= 1e-6:
-                tx = -math.sin(theta_center)
-                ty = math.cos(theta_center)
+                tx = -sin_t
+                ty = cos_t
                 length = math.hypot(tx, ty)
             tx /= length
             ty /= length
@@ -256,23 +290,31 @@ def draw_label_layers(
                 cursor += (advance * scale) / 2.0
                 x = cx + tx * cursor
                 y = cy + ty * cursor
-                glyph = _glyph(char)
-                _draw_glyph(core, glyph, (x, y), scale, rotation, base_color, 1.0)
-                _draw_glyph(glow, glyph, (x, y), scale * 1.6, rotation, base_color, 0.2)
+                _draw_glyph(core, char, (x, y), scale, rotation, base_color, 1.0)
+                _draw_glyph(glow, char, (x, y), scale * 1.6, rotation, base_color, 0.2)
                 cursor += (advance * scale) / 2.0
             continue
 
         effective_radius = max((spec.radius_x + spec.radius_y) * 0.5, 1.0)
         theta = placement.theta - placement.arc_angle / 2.0
-        for advance, char in zip(placement.advances, spec.text):
-            theta += (advance * scale) / (2.0 * effective_radius)
-            x = spec.center[0] + spec.radius_x * math.cos(theta)
-            y = spec.center[1] + spec.radius_y * math.sin(theta)
+        # Tabulate the glyph centre angles first so the trig runs as two
+        # map() sweeps rather than per-character Python calls.
+        thetas = []
+        for advance in placement.advances[: len(spec.text)]:
+            half_step = (advance * scale) / (2.0 * effective_radius)
+            theta += half_step
+            thetas.append(theta)
+            theta += half_step
+        center_x, center_y = spec.center
+        radius_x, radius_y = spec.radius_x, spec.radius_y
+        for char, theta, cos_t, sin_t in zip(
+            spec.text, thetas, map(math.cos, thetas), map(math.sin, thetas)
+        ):
+            x = center_x + radius_x * cos_t
+            y = center_y + radius_y * sin_t
             rotation = math.degrees(theta) - 90.0
-            glyph = _glyph(char)
-            _draw_glyph(core, glyph, (x, y), scale, rotation, base_color, 1.0)
-            _draw_glyph(glow, glyph, (x, y), scale * 1.6, rotation, base_color, 0.2)
-            theta += (advance * scale) / (2.0 * effective_radius)
+            _draw_glyph(core, char, (x, y), scale, rotation, base_color, 1.0)
+            _draw_glyph(glow, char, (x, y), scale * 1.6, rotation, base_color, 0.2)
 
     return core, glow
 
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Dict, Sequence, Tuple
+from itertools import chain
+from typing import Dict, List, Sequence, Tuple
 
-from .image import FloatImage, gaussian_blur, gaussian_kernel
-from .utils import clamp
+from .image import FloatImage, gaussian_blur, horizontal_blur
 
 
 def _bright_pass(image: FloatImage, threshold: float) -> FloatImage:
@@ -51,59 +51,28 @@ def _get_downsampled(
     return downsampled
 
 
-def _resample_nearest(image: FloatImage, width: int, height: int) -> FloatImage:
-    result = FloatImage.new(width, height, 0.0)
-    src_pixels = image.pixels
-    dst_pixels = result.pixels
-    src_width = max(1, image.width)
-    src_height = max(1, image.height)
-    for y in range(height):
-        src_y = min(src_height - 1, (y * src_height) // height)
-        src_row = src_pixels[src_y]
-        dst_row = dst_pixels[y]
-        for x in range(width):
-            src_x = min(src_width - 1, (x * src_width) // width)
-            src_pixel = src_row[src_x]
-            dst_pixel = dst_row[x]
-            dst_pixel[0] = src_pixel[0]
-            dst_pixel[1] = src_pixel[1]
-            dst_pixel[2] = src_pixel[2]
-    return result
+def _add_resampled(target: FloatImage, source: FloatImage, scale: float) -> None:
+    """Add ``source * scale`` onto ``target``, upsampling by nearest neighbour.
 
+    Equivalent to resampling ``source`` to the size of ``target`` and then
+    calling ``add_scaled_image``, without the full-resolution intermediate.
+    """
 
-def _horizontal_gaussian(image: FloatImage, sigma: float) -> FloatImage:
-    if sigma <= 0:
-        return image.copy()
-    kernel, radius = gaussian_kernel(sigma)
-    width, height = image.width, image.height
-    result = FloatImage.new(width, height, 0.0)
-    src_pixels = image.pixels
-    dst_pixels = result.pixels
-    for y in range(height):
-        src_row = src_pixels[y]
-        dst_row = dst_pixels[y]
-        for x in range(width):
-            acc0 = acc1 = acc2 = 0.0
-            start = x - radius
-            kernel_index = 0
-            if start < 0:
-                kernel_index = -start
-                start = 0
-            end = x + radius + 1
-            if end > width:
-                end = width
-            for xx in range(start, end):
-                weight = kernel[kernel_index]
-                pixel = src_row[xx]
-                acc0 += pixel[0] * weight
-                acc1 += pixel[1] * weight
-                acc2 += pixel[2] * weight
-                kernel_index += 1
-            dst_pixel = dst_row[x]
-            dst_pixel[0] = acc0
-            dst_pixel[1] = acc1
-            dst_pixel[2] = acc2
-    return result
+    width, height = target.width, target.height
+    if (source.width, source.height) == (width, height):
+        target.add_scaled_image(source, scale)
+        return
+    src_pixels = source.pixels
+    src_width = max(1, source.width)
+    src_height = max(1, source.height)
+    columns = [min(src_width - 1, (x * src_width) // width) for x in range(width)]
+    for y, dst_row in enumerate(target.pixels):
+        src_row = src_pixels[min(src_height - 1, (y * src_height) // height)]
+        for dst_pixel, src_x in zip(dst_row, columns):
+            src_pixel = src_row[src_x]
+            dst_pixel[0] += src_pixel[0] * scale
+            dst_pixel[1] += src_pixel[1] * scale
+            dst_pixel[2] += src_pixel[2] * scale
 
 
 def apply_bloom(
@@ -111,12 +80,19 @@ def apply_bloom(
     threshold: float,
     sigmas: Sequence[float],
     intensities: Sequence[float],
+    *,
+    in_place: bool = False,
 ) -> Tuple[FloatImage, FloatImage]:
+    """Add the blurred bright pass of ``image`` back onto it.
+
+    With ``in_place`` the glow accumulates straight into ``image`` rather
+    than into a copy; the pipeline uses this for its throwaway buffers.
+    """
+
     bright = _bright_pass(image, threshold)
-    result = image.copy()
+    result = image if in_place else image.copy()
     downsample_cache: Dict[int, FloatImage] = {1: bright}
     blurred_cache: Dict[Tuple[int, float], FloatImage] = {}
-    target_width, target_height = image.width, image.height
     for sigma, intensity in zip(sigmas, intensities):
         if intensity <= 0.0 or sigma <= 0.0:
             continue
@@ -126,15 +102,10 @@ def apply_bloom(
         cache_key = (factor, round(adjusted_sigma, 6))
         blurred = blurred_cache.get(cache_key)
         if blurred is None:
-            blurred_image = gaussian_blur(base, adjusted_sigma)
-            if factor != 1:
-                blurred = _resample_nearest(
-                    blurred_image, target_width, target_height
-                )
-            else:
-                blurred = blurred_image
+            blurred = gaussian_blur(base, adjusted_sigma)
             blurred_cache[cache_key] = blurred
-        result.add_scaled_image(blurred, intensity)
+        # Low-resolution levels are upsampled while they are accumulated.
+        _add_resampled(result, blurred, intensity)
     return result, bright
 
 
@@ -152,13 +123,8 @@ def apply_anamorphic_streak(
     downsample_cache: Dict[int, FloatImage] = {1: bright_pass}
     factor = _select_downsample_factor(sigma, bright_pass.width, bright_pass.height)
     base = _get_downsampled(bright_pass, factor, downsample_cache)
-    streak_base = _horizontal_gaussian(base, sigma / factor)
-    if factor != 1:
-        streak = _resample_nearest(streak_base, image.width, image.height)
-    else:
-        streak = streak_base
-
-    image.add_scaled_image(streak, intensity)
+    streak = horizontal_blur(base, sigma / factor)
+    _add_resampled(image, streak, intensity)
     return image
 
 
@@ -180,6 +146,7 @@ def apply_chromatic_aberration(
 
     result_pixels = result.pixels
     source_pixels = image.pixels
+    sample_channel = image.sample_channel
     for y in range(height):
         dst_row = result_pixels[y]
         for x in range(width):
@@ -196,20 +163,19 @@ def apply_chromatic_aberration(
             shift = (radius / max_radius) * pixels
             nx = dx / radius
             ny = dy / radius
-            red_sample = image.sample(x + nx * shift, y + ny * shift)
-            green_sample = image.sample(x, y)
-            blue_sample = image.sample(x - nx * shift, y - ny * shift)
+            # Only one channel of each shifted sample is kept, so sample just
+            # that channel; green sits on the pixel grid and is read directly.
             dst_pixel = dst_row[x]
-            dst_pixel[0] = red_sample[0]
-            dst_pixel[1] = green_sample[1]
-            dst_pixel[2] = blue_sample[2]
+            dst_pixel[0] = sample_channel(x + nx * shift, y + ny * shift, 0)
+            dst_pixel[1] = source_pixels[y][x][1]
+            dst_pixel[2] = sample_channel(x - nx * shift, y - ny * shift, 2)
     return result
 
 
-def apply_vignette(image: FloatImage, strength: float) -> FloatImage:
+def apply_vignette(image: FloatImage, strength: float, *, in_place: bool = False) -> FloatImage:
     if strength <= 0:
-        return image.copy()
-    result = image.copy()
+        return image if in_place else image.copy()
+    result = image if in_place else image.copy()
     cx = (image.width - 1) / 2.0
     cy = (image.height - 1) / 2.0
     max_radius = math.sqrt(cx * cx + cy * cy)
@@ -229,10 +195,12 @@ def apply_vignette(image: FloatImage, strength: float) -> FloatImage:
     return result
 
 
-def add_grain(image: FloatImage, amount: float, rng: random.Random) -> FloatImage:
+def add_grain(
+    image: FloatImage, amount: float, rng: random.Random, *, in_place: bool = False
+) -> FloatImage:
     if amount <= 0:
-        return image.copy()
-    result = image.copy()
+        return image if in_place else image.copy()
+    result = image if in_place else image.copy()
     result_pixels = result.pixels
     for row in result_pixels:
         for pixel in row:
@@ -246,21 +214,86 @@ def add_grain(image: FloatImage, amount: float, rng: random.Random) -> FloatImag
     return result
 
 
-def tone_map_aces(image: FloatImage, gamma: float = 2.2) -> FloatImage:
-    result = image.copy()
+def _tone_map_row(row: List[List[float]], inv_gamma: float) -> List[float]:
+    """Return the tone-mapped channel values of ``row`` as one flat list."""
+
     a, b, c, d, e = 2.51, 0.03, 2.43, 0.59, 0.14
+    mapped = [
+        (value * (a * value + b)) / (value * (c * value + d) + e)
+        for value in chain.from_iterable(row)
+    ]
+    # A clamped base and a positive exponent keep the result in [0, 1].
+    return [(0.0 if m < 0.0 else 1.0 if m > 1.0 else m) ** inv_gamma for m in mapped]
+
+
+def tone_map_aces(
+    image: FloatImage,
+    gamma: float = 2.2,
+    *,
+    in_place: bool = False,
+    downsample: int = 1,
+) -> FloatImage:
+    """Apply the ACES filmic curve and gamma to every channel.
+
+    The curve is the same for all three channels, so each row is processed
+    as one flat stream of channel values rather than pixel by pixel and
+    channel by channel. With ``downsample`` above one the tone-mapped rows are
+    area-averaged straight into a smaller image (see
+    :meth:`FloatImage.downsample`) and the full-size result is never stored.
+    """
+
     inv_gamma = 1.0 / max(gamma, 1e-3)
-    result_pixels = result.pixels
-    for row in result_pixels:
-        for pixel in row:
-            for i in range(3):
-                value = pixel[i]
-                mapped = (value * (a * value + b)) / (value * (c * value + d) + e)
-                mapped = clamp(mapped, 0.0, 1.0)
-                pixel[i] = clamp(mapped ** inv_gamma, 0.0, 1.0)
+    if downsample > 1:
+        return _tone_map_downsampled(image, inv_gamma, downsample)
+    result = image if in_place else image.copy()
+    for row in result.pixels:
+        values = iter(_tone_map_row(row, inv_gamma))
+        for pixel, red, green, blue in zip(row, values, values, values):
+            pixel[0] = red
+            pixel[1] = green
+            pixel[2] = blue
     return result
 
 
+def _tone_map_downsampled(image: FloatImage, inv_gamma: float, factor: int) -> FloatImage:
+    """Tone-map ``image`` and average ``factor`` x ``factor`` blocks in one pass.
+
+    Blocks are summed in the same order as :meth:`FloatImage.downsample`, so
+    the output matches tone-mapping first and downsampling afterwards. The
+    average is clamped to [0, 1] as it is written.
+    """
+
+    new_width = image.width // factor
+    new_height = image.height // factor
+    scale = 1.0 / (factor * factor)
+    rows: List[List[List[float]]] = []
+    for y in range(new_height):
+        block = []
+        for source in image.pixels[y * factor : (y + 1) * factor]:
+            values = iter(_tone_map_row(source, inv_gamma))
+            block.append(list(zip(values, values, values)))
+        row = []
+        for x0 in range(0, new_width * factor, factor):
+            acc0 = acc1 = acc2 = 0.0
+            for triples in block:
+                for red, green, blue in triples[x0 : x0 + factor]:
+                    acc0 += red
+                    acc1 += green
+                    acc2 += blue
+            acc0 *= scale
+            acc1 *= scale
+            acc2 *= scale
+            row.append(
+                [
+                    1.0 if acc0 > 1.0 else acc0,
+                    1.0 if acc1 > 1.0 else acc1,
+                    1.0 if acc2 > 1.0 else acc2,
+                ]
+            )
+        rows.append(row)
+    return FloatImage(width=new_width, height=new_height, pixels=rows)
+
+
 __all__ = [
     "apply_bloom",
     "apply_anamorphic_streak",
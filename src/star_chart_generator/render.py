@@ -1,8 +1,8 @@
 """High level rendering orchestrator."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
 
 import random
 
@@ -17,29 +17,59 @@ from .post import (
     apply_vignette,
     tone_map_aces,
 )
-from .sampling import downsample, generate_star_field, render_star_field
+from .sampling import downsample, generate_star_arrays, render_star_arrays
 from .shapes import render_ui_layers
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderResult:
     image: FloatImage
     layers: Dict[str, FloatImage]
+    _png: Dict[int, bytes] = field(default_factory=dict, init=False, repr=False, compare=False)
 
-    def save(self, path: str) -> None:
-        self.image.save_png(path)
+    def png_bytes(self, compress_level: int = 6) -> bytes:
+        """Return the final image encoded as PNG, encoding each level at most once."""
 
+        encoded = self._png.get(compress_level)
+        if encoded is None:
+            encoded = self.image.to_png_bytes(compress_level)
+            self._png[compress_level] = encoded
+        return encoded
 
-def generate_star_chart(config: SceneConfig, *, seed: Optional[int] = None) -> RenderResult:
+    def save(self, path: str, compress_level: int = 6) -> None:
+        with open(path, "wb") as fh:
+            fh.write(self.png_bytes(compress_level))
+
+
+def generate_star_chart(
+    config: SceneConfig,
+    *,
+    seed: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> RenderResult:
+    """Render ``config``; ``progress`` is called with each stage name as it starts.
+
+    The stages are ``"scene"``, ``"stars"``, ``"overlays"`` and ``"post"``.
+    """
+
+    def report(stage: str) -> None:
+        if progress is not None:
+            progress(stage)
+
+    report("scene")
     rng = random.Random(seed if seed is not None else config.seed)
     ssaa = max(1, config.resolution.ssaa)
 
     projection = create_projection(config.resolution, config.camera, config.rings)
 
-    stars = generate_star_field(config.stars, projection, rng, ssaa=ssaa)
-    star_layer = render_star_field(stars, projection)
+    report("stars")
+    stars = generate_star_arrays(config.stars, projection, rng, ssaa=ssaa)
+    star_layer = render_star_arrays(stars, projection)
+    report("overlays")
     ui_core, ui_glow = render_ui_layers(config, projection, ssaa=ssaa)
 
+    report("post")
+
     combined = star_layer.copy()
     combined.add_image(ui_core)
     combined.add_image(ui_glow)
@@ -49,6 +79,7 @@ def generate_star_chart(config: SceneConfig, *, seed: Optional[int] = None) -> R
         threshold=config.post.bloom.threshold,
         sigmas=tuple(sigma * ssaa for sigma in config.post.bloom.sigmas),
         intensities=config.post.bloom.intensities,
+        in_place=True,
     )
 
     if config.post.anamorphic.enabled:
@@ -64,17 +95,19 @@ def generate_star_chart(config: SceneConfig, *, seed: Optional[int] = None) -> R
         pixels=config.post.chromatic_aberration.pixels / ssaa,
         center=config.post.chromatic_aberration.center,
     )
-    vignetted = apply_vignette(aberrated, config.post.vignette)
-    grained = add_grain(vignetted, config.post.grain * ssaa, rng)
-    final_linear = tone_map_aces(grained, gamma=config.post.gamma)
+    # Every stage from here on owns its input, so it can work in place.
+    vignetted = apply_vignette(aberrated, config.post.vignette, in_place=True)
+    grained = add_grain(vignetted, config.post.grain * ssaa, rng, in_place=True)
+    # Tone mapping leaves values in [0, 1]; with SSAA it also does the
+    # downsample and the final clamp in the same pass.
+    final_linear = tone_map_aces(
+        grained, gamma=config.post.gamma, in_place=True, downsample=ssaa
+    )
 
     if ssaa > 1:
         star_layer = downsample(star_layer, ssaa)
         ui_core = downsample(ui_core, ssaa)
         ui_glow = downsample(ui_glow, ssaa)
-        final_linear = downsample(final_linear, ssaa)
-
-    final_linear.clamp(0.0, 1.0)
 
     layers = {
         "stars": star_layer,
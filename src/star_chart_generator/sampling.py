@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 import math
 import random
@@ -10,12 +10,12 @@ import random
 from .camera import ProjectionParams
 from .config import BackgroundDistribution, BulgeDistribution, StarConfig
 from .image import FloatImage
-from .utils import clamp, hex_to_rgb, mix_colors
+from .utils import clamp
 
 Color = Tuple[float, float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class Star:
     x: float
     y: float
@@ -24,27 +24,66 @@ class Star:
     color: Color
 
 
-def _sample_bulge_radius(
+@dataclass(slots=True)
+class StarArrays:
+    """Star field stored as parallel per-attribute lists (structure of arrays)."""
+
+    xs: List[float]
+    ys: List[float]
+    radii: List[float]
+    intensities: List[float]
+    colors: List[Color]
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def to_stars(self) -> List[Star]:
+        return [
+            Star(x=x, y=y, radius=radius, intensity=intensity, color=color)
+            for x, y, radius, intensity, color in zip(
+                self.xs, self.ys, self.radii, self.intensities, self.colors
+            )
+        ]
+
+
+def _bulge_radius_sampler(
     rng: random.Random, sigma: float, alpha: float
-) -> float:
-    """Sample a radius following an inverse-power falloff."""
+) -> Callable[[], float]:
+    """Return a sampler of radii following an inverse-power falloff.
+
+    The distribution constants depend only on ``sigma`` and ``alpha``, so they
+    are computed once per field rather than once per star.
+    """
 
     sigma = max(sigma, 1e-4)
     epsilon = sigma * 0.12 + 1e-4
+    random_ = rng.random
     if abs(alpha - 1.0) < 1e-6:
         span = math.log((sigma + epsilon) / epsilon)
-        value = math.exp(rng.random() * span) * epsilon - epsilon
+        exp = math.exp
+
+        def sample() -> float:
+            value = exp(random_() * span) * epsilon - epsilon
+            return clamp(value, 0.0, sigma)
+
     else:
         exponent = 1.0 - alpha
-        base = (sigma + epsilon) ** exponent - epsilon ** exponent
-        value = (rng.random() * base + epsilon ** exponent) ** (1.0 / exponent) - epsilon
-    return clamp(value, 0.0, sigma)
+        inverse = 1.0 / exponent
+        offset = epsilon ** exponent
+        base = (sigma + epsilon) ** exponent - offset
+
+        def sample() -> float:
+            value = (random_() * base + offset) ** inverse - epsilon
+            return clamp(value, 0.0, sigma)
+
+    return sample
 
 
 def _sample_background_position(
     rng: random.Random,
     projection: ProjectionParams,
     config: BackgroundDistribution,
+    project: Callable[[float, float], Tuple[float, float, float]],
 ) -> Tuple[float, float, float]:
     if config.max_r > config.min_r:
         u = rng.random()
@@ -53,7 +92,7 @@ def _sample_background_position(
             + config.min_r * config.min_r
         )
         angle = rng.random() * math.tau
-        x, y, depth = projection.project(radius, angle)
+        x, y, depth = project(radius, angle)
     else:
         x = rng.random() * projection.width
         y = rng.random() * projection.height
@@ -64,42 +103,89 @@ def _sample_background_position(
     return x, y, depth
 
 
-def generate_star_field(
+def generate_star_arrays(
     config: StarConfig,
     projection: ProjectionParams,
     rng: random.Random,
     ssaa: int,
-) -> List[Star]:
-    warm_color = hex_to_rgb(config.warm_color)
-    hot_color = hex_to_rgb(config.hot_color)
-    background_color = hex_to_rgb(config.background_color)
+) -> StarArrays:
+    """Sample the star field into per-attribute lists.
+
+    Per-field constants are looked up once and each loop appends to flat
+    lists instead of allocating a :class:`Star` per sample. Random numbers
+    are drawn in the order the original per-star loop drew them.
+    """
+
+    # Colours are mixed inline per star rather than through mix_colors, which
+    # would re-clamp and build a generator for every sample.
+    warm_r, warm_g, warm_b = config.warm_rgb
+    hot_r, hot_g, hot_b = config.hot_rgb
+    back_r, back_g, back_b = config.background_rgb
+
+    xs: List[float] = []
+    ys: List[float] = []
+    radii: List[float] = []
+    intensities: List[float] = []
+    colors: List[Color] = []
+    project = projection.projector()
+    random_ = rng.random
+    uniform = rng.uniform
+    tau = math.tau
+    distance = projection.distance
+
+    bulge = config.bulge
+    sample_radius = _bulge_radius_sampler(rng, bulge.sigma, bulge.falloff_alpha)
+    size_lo, size_hi = bulge.size_px
+    tightness_scale = max(bulge.sigma, 1e-3)
+    for _ in range(bulge.count):
+        angle = random_() * tau
+        radius = sample_radius()
+        x, y, depth = project(radius, angle)
+        scale = clamp(depth / distance, 0.4, 2.2)
+        radii.append(uniform(size_lo, size_hi) * ssaa * clamp(scale, 0.7, 1.8))
+        tightness = clamp(1.0 - radius / tightness_scale, 0.0, 1.0)
+        color_mix = clamp(tightness ** 0.85 + random_() * 0.2, 0.0, 1.0)
+        keep = 1.0 - color_mix
+        colors.append(
+            (
+                keep * warm_r + color_mix * hot_r,
+                keep * warm_g + color_mix * hot_g,
+                keep * warm_b + color_mix * hot_b,
+            )
+        )
+        intensities.append((1.15 + random_() * 1.5) * clamp(scale ** 0.6, 0.6, 1.9))
+        xs.append(x)
+        ys.append(y)
+
+    background = config.background
+    size_lo, size_hi = background.size_px
+    for _ in range(background.count):
+        x, y, depth = _sample_background_position(rng, projection, background, project)
+        scale = clamp(depth / distance, 0.5, 1.6)
+        radii.append(uniform(size_lo, size_hi) * ssaa * clamp(scale, 0.6, 1.4))
+        intensities.append(0.35 + random_() * 0.65)
+        hue_mix = clamp(random_() * 0.35 + 0.2, 0.0, 1.0)
+        keep = 1.0 - hue_mix
+        colors.append(
+            (
+                keep * back_r + hue_mix * warm_r,
+                keep * back_g + hue_mix * warm_g,
+                keep * back_b + hue_mix * warm_b,
+            )
+        )
+        xs.append(x)
+        ys.append(y)
 
-    stars: List[Star] = []
+    return StarArrays(xs, ys, radii, intensities, colors)
 
-    for _ in range(config.bulge.count):
-        angle = rng.random() * math.tau
-        radius = _sample_bulge_radius(
-            rng, config.bulge.sigma, config.bulge.falloff_alpha
-        )
-        x, y, depth = projection.project(radius, angle)
-        scale = clamp(depth / projection.distance, 0.4, 2.2)
-        size = rng.uniform(*config.bulge.size_px) * ssaa * clamp(scale, 0.7, 1.8)
-        tightness = clamp(1.0 - radius / max(config.bulge.sigma, 1e-3), 0.0, 1.0)
-        color_mix = clamp(tightness ** 0.85 + rng.random() * 0.2, 0.0, 1.0)
-        color = mix_colors(warm_color, hot_color, color_mix)
-        intensity = (1.15 + rng.random() * 1.5) * clamp(scale ** 0.6, 0.6, 1.9)
-        stars.append(Star(x=x, y=y, radius=size, intensity=intensity, color=color))
-
-    for _ in range(config.background.count):
-        x, y, depth = _sample_background_position(rng, projection, config.background)
-        scale = clamp(depth / projection.distance, 0.5, 1.6)
-        size = rng.uniform(*config.background.size_px) * ssaa * clamp(scale, 0.6, 1.4)
-        intensity = 0.35 + rng.random() * 0.65
-        hue_mix = clamp(rng.random() * 0.35 + 0.2, 0.0, 1.0)
-        color = mix_colors(background_color, warm_color, hue_mix)
-        stars.append(Star(x=x, y=y, radius=size, intensity=intensity, color=color))
-
-    return stars
+
+def generate_star_field(
+    config: StarConfig,
+    projection: ProjectionParams,
+    rng: random.Random,
+    ssaa: int,
+) -> List[Star]:
+    return generate_star_arrays(config, projection, rng, ssaa).to_stars()
 
 
 def render_star_field(stars: List[Star], projection: ProjectionParams) -> FloatImage:
@@ -110,8 +196,30 @@ def render_star_field(stars: List[Star], projection: ProjectionParams) -> FloatI
     return image
 
 
+def render_star_arrays(stars: StarArrays, projection: ProjectionParams) -> FloatImage:
+    """Like :func:`render_star_field` for a :class:`StarArrays` field."""
+
+    image = FloatImage.new(projection.width, projection.height, 0.0)
+    image.add_gaussians(
+        stars.xs,
+        stars.ys,
+        [max(0.5, radius / 2.0) for radius in stars.radii],
+        stars.intensities,
+        stars.colors,
+    )
+    return image
+
+
 def downsample(image: FloatImage, factor: int) -> FloatImage:
     return image.downsample(factor)
 
 
-__all__ = ["Star", "generate_star_field", "render_star_field", "downsample"]
+__all__ = [
+    "Star",
+    "StarArrays",
+    "generate_star_arrays",
+    "generate_star_field",
+    "render_star_arrays",
+    "render_star_field",
+    "downsample",
+]
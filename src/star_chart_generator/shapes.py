@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from typing import Iterable, List, Sequence, Tuple
 
 import math
@@ -13,7 +15,7 @@ from .labels import LabelSpec, draw_label_layers, draw_text_line, layout_labels
 from .utils import clamp, hex_to_rgb
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RingPoint:
     x: float
     y: float
@@ -21,6 +23,9 @@ class RingPoint:
     angle: float
 
 
+_HUD_LINE_COLOR = hex_to_rgb("#4384CE")
+_HUD_GLOW_COLOR = hex_to_rgb("#295a92")
+
 _DEFAULT_HUD_READOUTS: Tuple[HUDReadout, ...] = (
     HUDReadout(text="NAV 214.37", position=0.18, alignment="start"),
     HUDReadout(text="ΔV 0.993C", position=0.52, alignment="center"),
@@ -31,13 +36,24 @@ _DEFAULT_HUD_READOUTS: Tuple[HUDReadout, ...] = (
 def _sample_ring_points(
     projection: ProjectionParams, radius: float, *, samples: int
 ) -> List[RingPoint]:
-    points: List[RingPoint] = []
-    for index in range(samples):
-        angle = (index / samples) * math.tau
-        x, y, depth = projection.project(radius, angle)
-        scale = clamp(depth / projection.distance, 0.4, 2.2)
-        points.append(RingPoint(x=x, y=y, scale=scale, angle=angle))
-    return points
+    distance = projection.distance
+    return [
+        RingPoint(x=x, y=y, scale=clamp(depth / distance, 0.4, 2.2), angle=angle)
+        for x, y, depth, angle in projection.tessellate_ring(radius, samples)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _ring_outline(
+    projection: ProjectionParams, radius: float, samples: int
+) -> Tuple[RingPoint, ...]:
+    """Return the sampled points of a ring.
+
+    The outline depends only on geometry, not colour or glow, so repeated
+    renders of the same scene template reuse it.
+    """
+
+    return tuple(_sample_ring_points(projection, radius, samples=samples))
 
 
 def _draw_polyline(
@@ -113,32 +129,35 @@ def _draw_ticks(
         if spacing <= 0:
             continue
         count = max(1, int(round(360.0 / spacing)))
-        for index in range(count):
-            angle = math.radians(index * spacing)
-            x0, y0, depth0 = projection.project(inner, angle)
-            x1, y1, depth1 = projection.project(outer, angle)
+        angles = [math.radians(index * spacing) for index in range(count)]
+        inner_xs, inner_ys, inner_depths = projection.project_many(repeat(inner, count), angles)
+        outer_xs, outer_ys, outer_depths = projection.project_many(repeat(outer, count), angles)
+        core_widths = []
+        glow_widths = []
+        intensities = []
+        for depth0, depth1 in zip(inner_depths, outer_depths):
             scale = clamp((depth0 + depth1) * 0.5 / projection.distance, 0.5, 1.8)
             width = max(1.0, base_width * 0.45 * config.weight * scale)
-            intensity = config.alpha * (0.7 + 0.3 * min(scale, 1.4))
-            core.add_line((x0, y0), (x1, y1), color, int(max(1, round(width))), intensity)
-            glow.add_line(
-                (x0, y0),
-                (x1, y1),
-                halo_color,
-                int(max(1, round(width * 1.4))),
-                intensity * 0.4,
-            )
-
-
-def _ellipse_parameters(
-    projection: ProjectionParams, radius: float
-) -> Tuple[float, float, float]:
-    center_y, radius_x, radius_y = projection.ellipse_parameters(radius)
-    if radius_x <= 0.0:
-        radius_x = projection.base_radius * radius
-    if radius_y <= 0.0:
-        radius_y = max(radius_x * 0.12, 1.0)
-    return center_y, radius_x, radius_y
+            core_widths.append(int(max(1, round(width))))
+            glow_widths.append(int(max(1, round(width * 1.4))))
+            intensities.append(config.alpha * (0.7 + 0.3 * min(scale, 1.4)))
+        lines = list(zip(inner_xs, inner_ys, outer_xs, outer_ys))
+        core.add_lines(lines, color, core_widths, intensities)
+        glow.add_lines(lines, halo_color, glow_widths, [value * 0.4 for value in intensities])
+
+
+def _ellipse_parameters_many(
+    projection: ProjectionParams, radii: Sequence[float]
+) -> List[Tuple[float, float, float]]:
+    centers, radii_x, radii_y = projection.ellipse_parameters_many(radii)
+    parameters: List[Tuple[float, float, float]] = []
+    for radius, center_y, radius_x, radius_y in zip(radii, centers, radii_x, radii_y):
+        if radius_x <= 0.0:
+            radius_x = projection.base_radius * radius
+        if radius_y <= 0.0:
+            radius_y = max(radius_x * 0.12, 1.0)
+        parameters.append((center_y, radius_x, radius_y))
+    return parameters
 
 
 def _build_label_specs(
@@ -146,31 +165,22 @@ def _build_label_specs(
     projection: ProjectionParams,
     ssaa: int,
 ) -> List[LabelSpec]:
-    label_specs: List[LabelSpec] = []
     label_scale = max(1.0, config.text.size_px / 18.0) * ssaa
 
+    # Gather every label radius first so the ellipses are solved in one batch.
+    radii: List[float] = []
+    entries: List[Tuple[int, str, float, str, str]] = []
+
     for index, ring in enumerate(config.rings):
         if not ring.label:
             continue
-        label_radius = ring.r + ring.width * 0.5 + ring.label_offset
-        center_y, radius_x, radius_y = _ellipse_parameters(projection, label_radius)
+        radii.append(ring.r + ring.width * 0.5 + ring.label_offset)
         angle = (
             math.radians(ring.label_angle_deg)
             if ring.label_angle_deg is not None
             else math.pi / 2.0
         )
-        label_specs.append(
-            LabelSpec(
-                ring_index=index,
-                text=ring.label,
-                center=(projection.center_x, center_y),
-                radius_x=radius_x,
-                radius_y=radius_y,
-                initial_angle=angle,
-                tracking=config.text.tracking,
-                scale=label_scale,
-            )
-        )
+        entries.append((index, ring.label, angle, "center", "arc"))
 
     for readout in config.readouts:
         ring_index = readout.placement.ring_index
@@ -178,28 +188,30 @@ def _build_label_specs(
             continue
         ring = config.rings[ring_index]
         if readout.placement.radius is not None:
-            label_radius = float(readout.placement.radius)
+            radii.append(float(readout.placement.radius))
         else:
-            label_radius = ring.r + readout.placement.radial_offset
-        center_y, radius_x, radius_y = _ellipse_parameters(projection, label_radius)
+            radii.append(ring.r + readout.placement.radial_offset)
         angle = math.radians(readout.placement.angle_deg)
         baseline = "linear" if readout.placement.kind == "linear" else "arc"
-        label_specs.append(
-            LabelSpec(
-                ring_index=ring_index,
-                text=readout.text,
-                center=(projection.center_x, center_y),
-                radius_x=radius_x,
-                radius_y=radius_y,
-                initial_angle=angle,
-                tracking=config.text.tracking,
-                scale=label_scale,
-                alignment=readout.alignment,
-                baseline=baseline,
-            )
+        entries.append((ring_index, readout.text, angle, readout.alignment, baseline))
+
+    return [
+        LabelSpec(
+            ring_index=ring_index,
+            text=text,
+            center=(projection.center_x, center_y),
+            radius_x=radius_x,
+            radius_y=radius_y,
+            initial_angle=angle,
+            tracking=config.text.tracking,
+            scale=label_scale,
+            alignment=alignment,
+            baseline=baseline,
         )
-
-    return label_specs
+        for (ring_index, text, angle, alignment, baseline), (center_y, radius_x, radius_y) in zip(
+            entries, _ellipse_parameters_many(projection, radii)
+        )
+    ]
 
 
 def _draw_hud(
@@ -214,8 +226,8 @@ def _draw_hud(
 ) -> None:
     band_height = max(24 * ssaa, int(ssaa * 1.0 * projection.height * 0.08))
     baseline_y = projection.height - band_height * 0.4
-    line_color = hex_to_rgb("#4384CE")
-    glow_color = hex_to_rgb("#295a92")
+    line_color = _HUD_LINE_COLOR
+    glow_color = _HUD_GLOW_COLOR
     line_width = max(1, int(2 * ssaa))
     core.add_line((0.0, baseline_y), (projection.width, baseline_y), line_color, line_width, 0.9)
     glow.add_line((0.0, baseline_y), (projection.width, baseline_y), line_color, line_width + 2, 0.35 * emissive)
@@ -263,14 +275,20 @@ def render_ui_layers(
     core = FloatImage.new(width, height, 0.0)
     glow = FloatImage.new(width, height, 0.0)
 
-    for index, ring in enumerate(config.rings):
-        radius = max(1e-4, ring.r)
-        base_width = max(1.0, ring.width * projection.base_radius)
+    arrays = config.ring_arrays
+    for ring, ring_radius, ring_width, glow_strength, color, halo_color in zip(
+        config.rings,
+        arrays.radii,
+        arrays.widths,
+        arrays.glows,
+        arrays.colors,
+        arrays.halo_colors,
+    ):
+        radius = max(1e-4, ring_radius)
+        base_width = max(1.0, ring_width * projection.base_radius)
         samples = max(240, int(360 * clamp(radius, 0.25, 1.0)))
-        points = _sample_ring_points(projection, radius, samples=samples)
-        color = hex_to_rgb(ring.color)
-        halo_color = hex_to_rgb(ring.halo_color or ring.color)
-        _draw_ring(core, glow, points, base_width, color, halo_color, ring.glow)
+        points = _ring_outline(projection, radius, samples)
+        _draw_ring(core, glow, points, base_width, color, halo_color, glow_strength)
 
         if ring.tick or ring.ticks_every_deg:
             if ring.tick is not None:
@@ -302,8 +320,7 @@ def render_ui_layers(
     label_specs = _build_label_specs(config, projection, ssaa)
     if label_specs:
         placements = layout_labels(label_specs)
-        label_core, label_glow = draw_label_layers((width, height), placements, config.text)
-        core.add_image(label_core)
+        _, label_glow = draw_label_layers((width, height), placements, config.text, core=core)
         glow.add_image(gaussian_blur(label_glow, 2.0 * ssaa))
 
     if config.hud.use_default_readouts and not config.hud.readouts:
@@ -312,7 +329,7 @@ def render_ui_layers(
         hud_readouts = config.hud.readouts
 
     if config.hud.enabled and hud_readouts:
-        text_color = hex_to_rgb(config.text.color)
+        text_color = config.text.rgb
         _draw_hud(
             core,
             glow,
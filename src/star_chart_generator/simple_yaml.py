@@ -0,0 +1,119 @@
+"""Minimal YAML subset parser used when PyYAML is not installed.
+
+Supports nested mappings, block lists and flow-style ``[...]``/``{...}``
+scalars, which is enough for the bundled scene files. Anchors, aliases and
+multi-line strings need PyYAML.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import ast
+import re
+
+_SCALAR_KEYWORDS: Dict[str, Any] = {"true": True, "false": False, "null": None}
+
+# One match classifies a token as int, hex int or float without the old
+# try/except cascade; anything else stays a string.
+_NUMBER_RE = re.compile(
+    r"(?P<int>[-+]?\d+(?:_\d+)*)"
+    r"|(?P<hex>0x[0-9a-fA-F]+)"
+    r"|(?P<float>[-+]?(?:(?:\d+(?:_\d+)*)?\.\d+(?:_\d+)*|\d+(?:_\d+)*\.?)"
+    r"(?:[eE][-+]?\d+(?:_\d+)*)?"
+    r"|[-+]?(?i:inf|infinity|nan))"
+)
+
+
+def load(text: str) -> Any:
+    """Parse the block-style YAML subset used by the bundled scene files."""
+
+    lines = []
+    for raw in text.splitlines():
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(raw) - len(raw.lstrip(" "))
+        lines.append((indent, stripped))
+    value, _ = _parse_block(lines, 0, 0)
+    return value
+
+
+def _parse_block(lines: List[Tuple[int, str]], index: int, indent: int) -> Tuple[Any, int]:
+    if index >= len(lines):
+        return {}, index
+    level, content = lines[index]
+    if content.startswith("- ") and level == indent:
+        return _parse_list(lines, index, indent)
+    result: Dict[str, Any] = {}
+    while index < len(lines):
+        level, content = lines[index]
+        if level < indent or content.startswith("- "):
+            break
+        if ":" not in content:
+            index += 1
+            continue
+        key, remainder = content.split(":", 1)
+        key = key.strip()
+        remainder = remainder.strip()
+        index += 1
+        if remainder:
+            result[key] = _parse_scalar(remainder)
+        else:
+            value, index = _parse_block(lines, index, indent + 2)
+            result[key] = value
+    return result, index
+
+
+def _parse_list(lines: List[Tuple[int, str]], index: int, indent: int) -> Tuple[List[Any], int]:
+    items: List[Any] = []
+    while index < len(lines):
+        level, content = lines[index]
+        if level < indent or not content.startswith("- "):
+            break
+        remainder = content[2:].strip()
+        index += 1
+        if remainder:
+            if ":" in remainder:
+                key, value_part = remainder.split(":", 1)
+                key = key.strip()
+                value_part = value_part.strip()
+                item: Dict[str, Any] = {}
+                item[key] = _parse_scalar(value_part) if value_part else None
+                if value_part == "":
+                    subvalue, index = _parse_block(lines, index, indent + 2)
+                    item[key] = subvalue
+                else:
+                    subvalue, index = _parse_block(lines, index, indent + 2)
+                    if isinstance(subvalue, dict):
+                        item.update(subvalue)
+                items.append(item)
+            else:
+                items.append(_parse_scalar(remainder))
+        else:
+            value, index = _parse_block(lines, index, indent + 2)
+            items.append(value)
+    return items, index
+
+
+def _parse_scalar(token: str) -> Any:
+    if token.startswith("\"") and token.endswith("\""):
+        return token[1:-1]
+    if token.startswith("'") and token.endswith("'"):
+        return token[1:-1]
+    lowered = token.lower()
+    if lowered in _SCALAR_KEYWORDS:
+        return _SCALAR_KEYWORDS[lowered]
+    if token.startswith("[") or token.startswith("{"):
+        return ast.literal_eval(token)
+    match = _NUMBER_RE.fullmatch(token)
+    if match is None:
+        return token
+    kind = match.lastgroup
+    if kind == "int":
+        return int(token)
+    if kind == "hex":
+        return int(token, 16)
+    return float(token)
+
+
+__all__ = ["load"]
@@ -1,8 +1,9 @@
 """Utility helpers shared across the generator modules."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Sequence, Tuple
+from typing import Optional, Sequence, Tuple, Union
 
 
 def clamp(value: float, lo: float, hi: float) -> float:
@@ -11,19 +12,30 @@ def clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
-def hex_to_rgb(color: str) -> Tuple[float, float, float]:
-    """Convert a hex color string into an RGB tuple with floats in ``[0, 1]``."""
+def hex_to_rgb(color: Union[str, Sequence[float]]) -> Tuple[float, float, float]:
+    """Convert a hex color string into an RGB tuple with floats in ``[0, 1]``.
 
+    Colours that are already RGB sequences are passed through as tuples, so
+    callers can hand over either form.
+    """
+
+    if isinstance(color, str):
+        return _parse_hex(color)
+    r, g, b = color
+    return (float(r), float(g), float(b))
+
+
+@lru_cache(maxsize=256)
+def _parse_hex(color: str) -> Tuple[float, float, float]:
+    # Scenes reuse a handful of colours many times, so parses are memoised.
     color = color.strip()
     if color.startswith("#"):
         color = color[1:]
     if len(color) not in (3, 6):
         raise ValueError(f"Unsupported color format: {color!r}")
     if len(color) == 3:
-        color = "".join(ch * 2 for ch in color)
-    r = int(color[0:2], 16)
-    g = int(color[2:4], 16)
-    b = int(color[4:6], 16)
+        color = color[0] * 2 + color[1] * 2 + color[2] * 2
+    r, g, b = bytes.fromhex(color)
     return (r / 255.0, g / 255.0, b / 255.0)
 
 
@@ -3,7 +3,16 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_cache(tmp_path_factory, monkeypatch):
+    """Keep parsed-YAML caches written during tests out of the user's cache."""
+
+    monkeypatch.setenv("STAR_CHART_CACHE_DIR", str(tmp_path_factory.mktemp("config-cache")))
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+
+from star_chart_generator.camera import PROJECTION_RECORD, create_projection
+from star_chart_generator.config import Camera, Resolution
+
+
+def test_project_many_matches_project():
+    projection = create_projection(
+        Resolution(width=320, height=240, ssaa=2), Camera(pitch_deg=74, fov_deg=35, z_far=6.0), []
+    )
+    radii = [0.0, 0.25, 0.5, 0.75, 1.0, 1.2]
+    angles = [index * math.tau / len(radii) for index in range(len(radii))]
+
+    xs, ys, depths = projection.project_many(radii, angles)
+
+    assert (xs, ys, depths) == tuple(
+        map(list, zip(*(projection.project(radius, angle) for radius, angle in zip(radii, angles))))
+    )
+
+
+def test_project_keeps_reference_evaluation_order():
+    for pitch in (0.0, 74.0):
+        projection = create_projection(
+            Resolution(width=320, height=240, ssaa=1), Camera(pitch_deg=pitch, fov_deg=35, z_far=6.0), []
+        )
+        for radius, angle in ((0.25, 0.4), (0.8, 2.2), (1.1, 4.9)):
+            # The original formulation: world units first, focal length last.
+            x_world = math.cos(angle) * radius * projection.unit_scale
+            y_world = math.sin(angle) * radius * projection.unit_scale
+            y_prime = y_world * math.cos(projection.pitch)
+            z_camera = max(projection.distance + y_world * math.sin(projection.pitch), 1e-5)
+            expected = (
+                projection.center_x + (projection.focal_length * x_world) / z_camera,
+                projection.center_y + (projection.focal_length * y_prime) / z_camera,
+                z_camera,
+            )
+
+            assert projection.project(radius, angle) == expected
+
+
+def test_ellipse_parameters_match_projected_extremes():
+    projection = create_projection(
+        Resolution(width=256, height=256, ssaa=1), Camera(pitch_deg=78, fov_deg=33, z_far=5.5), []
+    )
+    for radius in (0.1, 0.45, 1.0):
+        side_x, _, _ = projection.project(radius, 0.0)
+        _, near_y, _ = projection.project(radius, math.pi / 2.0)
+        _, far_y, _ = projection.project(radius, -math.pi / 2.0)
+
+        center_y, radius_x, radius_y = projection.ellipse_parameters(radius)
+
+        assert center_y == (near_y + far_y) * 0.5
+        assert radius_x == abs(side_x - projection.center_x)
+        assert radius_y == abs(near_y - center_y)
+
+    assert projection.ellipse_parameters(0.0) == (projection.center_y, 0.0, 0.0)
+
+
+def test_project_into_reuses_buffers():
+    projection = create_projection(
+        Resolution(width=128, height=128, ssaa=1), Camera(pitch_deg=60, fov_deg=35, z_far=6.0), []
+    )
+    xs = [0.0] * 8
+    ys = [0.0] * 8
+    depths = [0.0] * 8
+    angles = [0.3, 1.2, 2.5]
+
+    written = projection.project_into([0.4] * 3, angles, xs, ys, depths)
+
+    assert written == 3
+    assert (xs[:3], ys[:3], depths[:3]) == projection.project_many([0.4] * 3, angles)
+    assert xs[3:] == [0.0] * 5
+
+
+def test_projector_matches_project():
+    projection = create_projection(
+        Resolution(width=200, height=150, ssaa=1), Camera(pitch_deg=83, fov_deg=35, z_far=6.0), []
+    )
+    project = projection.projector()
+
+    for radius, angle in ((0.0, 0.0), (0.35, 1.1), (0.9, 4.0), (1.3, 2.0)):
+        assert project(radius, angle) == projection.project(radius, angle)
+
+
+def test_level_camera_projection_follows_pitch_data():
+    resolution = Resolution(width=200, height=150, ssaa=1)
+    flat = create_projection(resolution, Camera(pitch_deg=0.0, fov_deg=35, z_far=6.0), [])
+    general = create_projection(resolution, Camera(pitch_deg=1e-3, fov_deg=35, z_far=6.0), [])
+
+    project = flat.projector()
+    radii = [0.0, 0.3, 0.8, 1.5]
+    angles = [0.0, 1.0, 2.5, 4.0]
+    xs, ys, depths = flat.project_many(radii, angles)
+    for index, (radius, angle) in enumerate(zip(radii, angles)):
+        expected = flat.project(radius, angle)
+        assert project(radius, angle) == expected
+        assert (xs[index], ys[index], depths[index]) == expected
+        assert expected[2] == flat.distance
+        for actual, reference in zip(expected, general.project(radius, angle)):
+            assert math.isclose(actual, reference, rel_tol=1e-4, abs_tol=1e-3)
+
+    # The level-camera path is chosen from the pitch fields, not fixed at creation.
+    tilted = dataclasses.replace(
+        flat, pitch=general.pitch, cos_pitch=general.cos_pitch, sin_pitch=general.sin_pitch
+    )
+    assert tilted.project(0.8, 2.5) == general.project(0.8, 2.5)
+
+
+def test_project_safe_clamps_negative_radius():
+    projection = create_projection(
+        Resolution(width=64, height=64, ssaa=1), Camera(pitch_deg=70, fov_deg=35, z_far=6.0), []
+    )
+
+    assert projection.project_safe(-0.4, 1.0) == projection.project(0.0, 1.0)
+
+
+def test_as_record_packs_float32_fields():
+    projection = create_projection(
+        Resolution(width=640, height=480, ssaa=1), Camera(pitch_deg=80, fov_deg=35, z_far=6.0), []
+    )
+
+    record = projection.as_record()
+
+    assert len(record) == PROJECTION_RECORD.size == 36
+    width, height, center_x, center_y, *rest = PROJECTION_RECORD.unpack(record)
+    assert (width, height) == (640, 480)
+    assert (center_x, center_y) == (320.0, 240.0)
+    assert math.isclose(rest[-1], projection.sin_pitch, rel_tol=1e-6)
+
+
+def test_tessellate_ring_matches_project():
+    for pitch in (0.0, 72.0):
+        projection = create_projection(
+            Resolution(width=320, height=240, ssaa=1), Camera(pitch_deg=pitch, fov_deg=35, z_far=6.0), []
+        )
+
+        points = projection.tessellate_ring(0.6, 48)
+
+        assert len(points) == 48
+        for index, (x, y, depth, angle) in enumerate(points):
+            assert angle == (index / 48) * math.tau
+            assert (x, y, depth) == projection.project(0.6, angle)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
 import math
+import os
+from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
 from star_chart_generator import QualityPreset, SceneConfig
+from star_chart_generator.config import _read_config_data
 
 
 def _make_config() -> SceneConfig:
@@ -132,3 +137,206 @@ def test_missing_hud_section_uses_defaults():
 
     assert config.hud.enabled is True
     assert config.hud.use_default_readouts is True
+
+
+def test_load_reuses_parsed_config_until_file_changes(tmp_path):
+    path = tmp_path / "scene.yaml"
+    path.write_text("seed: 3\nresolution:\n  width: 64\n  height: 48\n", encoding="utf8")
+
+    first = SceneConfig.load(path)
+    assert SceneConfig.load(path) is first
+
+    path.write_text("seed: 4\nresolution:\n  width: 64\n  height: 48\n", encoding="utf8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = SceneConfig.load(path)
+    assert reloaded is not first
+    assert reloaded.seed == 4
+
+
+def test_negative_ring_radius_is_rejected():
+    scene = _base_scene(rings=[{"r": -0.1, "width": 0.01, "color": "#ffffff"}])
+
+    with pytest.raises(ValueError):
+        SceneConfig.from_dict(scene)
+
+
+def test_alias_keys_fall_back_in_order():
+    scene = _base_scene(
+        post={"chromab": None, "chromatic_aberration": {"k": 2.5}},
+        hud={"height": 96},
+    )
+
+    config = SceneConfig.from_dict(scene)
+
+    assert config.post.chromatic_aberration.pixels == 2.5
+    assert config.hud.height_px == 96
+
+
+def test_load_writes_and_reuses_json_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("STAR_CHART_CACHE_DIR", str(cache_dir))
+    config_dir = tmp_path / "configs"
+    config_dir.mkdir()
+    path = config_dir / "cached.yaml"
+    path.write_text("seed: 7\nresolution:\n  width: 32\n  height: 24\n", encoding="utf8")
+    listing_mtime = config_dir.stat().st_mtime_ns
+
+    SceneConfig.load(path)
+    (cache_file,) = cache_dir.iterdir()
+    assert config_dir.stat().st_mtime_ns == listing_mtime
+    assert [entry.name for entry in config_dir.iterdir()] == ["cached.yaml"]
+
+    # A cache entry whose stamp matches the source is trusted over the YAML.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    stamp = [stat.st_mtime_ns - 1_000_000_000, stat.st_size]
+    cache_file.write_text(
+        json.dumps({"source": stamp, "data": {"seed": 9, "resolution": {"width": 32, "height": 24}}}),
+        encoding="utf8",
+    )
+    assert SceneConfig.load(path).seed == 9
+
+
+def test_json_cache_returns_same_data_on_every_load(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("STAR_CHART_CACHE_DIR", str(cache_dir))
+    lossy = tmp_path / "lossy.yaml"
+    lossy.write_text("seed: 1\nlabels:\n  1: a\nwhen: 2024-01-02\n", encoding="utf8")
+    plain = tmp_path / "plain.yaml"
+    plain.write_text("seed: 2\nlabels:\n  one: a\n", encoding="utf8")
+
+    for path in (lossy, plain):
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        first = _read_config_data(path, stamp)
+        assert _read_config_data(path, stamp) == first
+
+    assert _read_config_data(lossy, (0, 0))["labels"] == {1: "a"}
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_load_cache_is_keyed_by_absolute_path(tmp_path, monkeypatch):
+    path = tmp_path / "scene.yaml"
+    path.write_text("seed: 5\nresolution:\n  width: 64\n  height: 48\n", encoding="utf8")
+    monkeypatch.chdir(tmp_path)
+
+    assert SceneConfig.load("scene.yaml") is SceneConfig.load(path)
+
+
+def test_load_reads_json_and_toml_scenes(tmp_path):
+    json_path = tmp_path / "scene.json"
+    json_path.write_text('{"seed": 11, "resolution": {"width": 64, "height": 48}}', encoding="utf8")
+    toml_path = tmp_path / "scene.toml"
+    toml_path.write_text("seed = 12\n[resolution]\nwidth = 64\nheight = 48\n", encoding="utf8")
+
+    assert SceneConfig.load(json_path).seed == 11
+    assert SceneConfig.load(toml_path).seed == 12
+    assert not (tmp_path / "scene.json.cache.json").exists()
+
+
+def test_from_dict_cached_shares_configs_for_equal_mappings():
+    first = SceneConfig.from_dict_cached(_base_scene())
+
+    assert SceneConfig.from_dict_cached(_base_scene()) is first
+    assert SceneConfig.from_dict_cached(_base_scene(seed=2)) is not first
+
+
+def test_from_dict_cached_bypasses_input_json_cannot_key_exactly():
+    mixed_keys = _base_scene()
+    mixed_keys[1] = "x"
+    assert SceneConfig.from_dict_cached(mixed_keys).seed == 1
+    int_keys = _base_scene(labels={1: "a"})
+    assert SceneConfig.from_dict_cached(int_keys) is not SceneConfig.from_dict_cached(int_keys)
+
+    # A value whose str() matches a JSON string must not share its entry.
+    named = _base_scene(note=Path("x"))
+    plain = SceneConfig.from_dict_cached(_base_scene(note="x"))
+    assert SceneConfig.from_dict_cached(named) is not plain
+
+
+def test_chromatic_center_accepts_lists_and_pair_strings():
+    def center(value):
+        scene = _base_scene(post={"chromab": {"center": value}})
+        return SceneConfig.from_dict(scene).post.chromatic_aberration.center
+
+    assert center([0.4, 0.6]) == (0.4, 0.6)
+    assert center("0.25, 0.75") == (0.25, 0.75)
+    assert center("image_center") is None
+    assert center("left,top") is None
+
+
+def test_config_module_star_import_resolves():
+    from star_chart_generator import config
+
+    for name in config.__all__:
+        assert hasattr(config, name), name
+
+
+@pytest.mark.parametrize(
+    ("overrides", "path"),
+    [
+        ({"resolution": {"width": 320}}, "resolution.height"),
+        ({"rings": {"r": 0.3}}, "rings"),
+        ({"post": {"bloom": [1.0]}}, "post.bloom"),
+    ],
+)
+def test_from_dict_reports_the_invalid_path(overrides, path):
+    with pytest.raises(ValueError, match=path):
+        SceneConfig.from_dict(_base_scene(**overrides))
+
+
+def test_from_dict_accepts_tuple_lists_and_read_only_mappings():
+    scene = _base_scene(
+        resolution=MappingProxyType({"width": 64, "height": 48}),
+        rings=({"r": 0.5, "color": "#fff"},),
+        readouts=({"text": "A", "placement": {"type": "arc", "ring": 0}},),
+    )
+
+    config = SceneConfig.from_dict(MappingProxyType(scene))
+
+    assert config.resolution.width == 64
+    assert [ring.r for ring in config.rings] == [0.5]
+    assert config.readouts[0].text == "A"
+
+
+def test_alias_keys_are_normalised_with_canonical_priority():
+    scene = _base_scene(
+        camera={"tilt_deg": 60.0},
+        stars={"core": {"count": 10, "alpha": 2.5}, "bg": {"count": 20}},
+        readouts=[{"text": "A", "placement": {"kind": "linear", "type": "arc", "ring_index": 0}}],
+    )
+
+    config = SceneConfig.from_dict(scene)
+
+    assert config.camera.pitch_deg == 60.0
+    assert config.stars.bulge.count == 10
+    assert config.stars.bulge.falloff_alpha == 2.5
+    assert config.stars.background.count == 20
+    assert config.readouts[0].placement.kind == "arc"
+
+
+def test_load_cache_notices_size_change_with_same_mtime(tmp_path):
+    path = tmp_path / "scene.yaml"
+    path.write_text("seed: 1\nresolution:\n  width: 64\n  height: 48\n", encoding="utf8")
+    stat = path.stat()
+    first = SceneConfig.load(path)
+
+    path.write_text("seed: 22\nresolution:\n  width: 64\n  height: 48\n", encoding="utf8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert SceneConfig.load(path).seed == 22
+    assert first.seed == 1
+
+
+def test_colours_are_converted_once_at_load():
+    resolution = {"width": 64, "height": 48}
+    config = SceneConfig.from_dict(
+        {"resolution": resolution, "text": {"color": "#ff0000"}, "stars": {"hot_color": "#00ff00"}}
+    )
+
+    assert config.text.rgb == (1.0, 0.0, 0.0)
+    assert config.stars.hot_rgb == (0.0, 1.0, 0.0)
+    with pytest.raises(ValueError):
+        SceneConfig.from_dict({"resolution": resolution, "text": {"color": "#12345"}})
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from star_chart_generator.image import FloatImage, gaussian_blur, gaussian_kernel, horizontal_blur
+
+
+def test_from_rgb_bytes_round_trips_uint8_rows():
+    image = FloatImage.new(5, 3, 0.0)
+    for y in range(image.height):
+        for x in range(image.width):
+            image.pixels[y][x] = [x / 4.0, y / 2.0, (x + y) / 6.0]
+
+    packed = b"".join(bytes(row[1:]) for row in image.to_uint8_rows())
+    decoded = FloatImage.from_rgb_bytes(image.width, image.height, packed)
+
+    assert decoded.width == image.width
+    assert decoded.height == image.height
+    for y in range(image.height):
+        for x in range(image.width):
+            for expected, actual in zip(image.get_pixel(x, y), decoded.get_pixel(x, y)):
+                assert abs(expected - actual) <= 0.5 / 255.0 + 1e-9
+
+
+def test_gaussian_blur_spreads_impulse_as_separable_kernel():
+    image = FloatImage.new(9, 7, 0.0)
+    image.pixels[3][4] = [1.0, 0.5, 0.0]
+    kernel, radius = gaussian_kernel(1.0)
+
+    blurred = gaussian_blur(image, 1.0)
+
+    for y in range(image.height):
+        for x in range(image.width):
+            dx, dy = x - 4, y - 3
+            if abs(dx) > radius or abs(dy) > radius:
+                expected = 0.0
+            else:
+                expected = kernel[dx + radius] * kernel[dy + radius]
+            red, green, blue = blurred.get_pixel(x, y)
+            assert abs(red - expected) <= 1e-12
+            assert abs(green - expected * 0.5) <= 1e-12
+            assert blue == 0.0
+
+
+def test_horizontal_blur_keeps_rows_separate():
+    image = FloatImage.new(9, 3, 0.0)
+    image.pixels[1][4] = [1.0, 1.0, 1.0]
+    kernel, radius = gaussian_kernel(1.5)
+
+    blurred = horizontal_blur(image, 1.5)
+
+    assert all(pixel == [0.0, 0.0, 0.0] for y in (0, 2) for pixel in blurred.pixels[y])
+    for x in range(image.width):
+        dx = x - 4
+        expected = kernel[dx + radius] if abs(dx) <= radius else 0.0
+        assert blurred.get_pixel(x, 1) == (expected, expected, expected)
+
+
+def test_apply_map_and_multiply_update_pixels_in_place():
+    image = FloatImage.new(2, 2, 0.5)
+    first = image.pixels[0][0]
+
+    image.apply_map(lambda r, g, b: (r * 2.0, g, b * 0.0))
+    image.multiply(0.5)
+
+    assert image.pixels[0][0] is first
+    assert all(pixel == [0.5, 0.25, 0.0] for row in image.pixels for pixel in row)
+
+
+def test_sample_channel_matches_sample():
+    image = FloatImage.new(4, 3, 0.0)
+    for y in range(image.height):
+        for x in range(image.width):
+            image.pixels[y][x] = [x * 0.3, y * 0.7, (x + 2 * y) * 0.1]
+
+    for x, y in ((0.0, 0.0), (1.25, 0.5), (2.9, 1.99), (-1.0, 4.0), (3.0, 2.0)):
+        expected = image.sample(x, y)
+        assert tuple(image.sample_channel(x, y, c) for c in range(3)) == expected
+
+
+def test_wide_blur_uses_box_cascade_close_to_gaussian():
+    image = FloatImage.new(81, 61, 0.0)
+    image.pixels[30][40] = [1.0, 0.5, 0.0]
+    sigma = 10.0
+    kernel, radius = gaussian_kernel(sigma)
+
+    blurred = gaussian_blur(image, sigma)
+
+    assert abs(sum(pixel[0] for row in blurred.pixels for pixel in row) - 1.0) < 1e-9
+    assert all(pixel[2] == 0.0 for row in blurred.pixels for pixel in row)
+    peak = kernel[radius] * kernel[radius]
+    assert abs(blurred.get_pixel(40, 30)[0] - peak) < 0.15 * peak
+    assert abs(blurred.get_pixel(40, 30)[1] - 0.5 * blurred.get_pixel(40, 30)[0]) < 1e-12
+
+
+def test_gaussian_kernel_is_cached_and_normalised():
+    kernel, radius = gaussian_kernel(2.0)
+
+    assert gaussian_kernel(2.0)[0] is kernel
+    assert isinstance(kernel, tuple)
+    assert len(kernel) == 2 * radius + 1
+    assert abs(sum(kernel) - 1.0) < 1e-12
+    assert kernel == kernel[::-1]
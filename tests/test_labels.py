@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 
 from star_chart_generator.config import TextConfig
+from star_chart_generator.image import FloatImage
 from star_chart_generator.labels import LabelSpec, draw_label_layers, layout_labels
 
 
@@ -63,3 +64,8 @@ def test_label_layout_resolves_collisions():
     glow_energy = sum(channel for row in glow.pixels for pixel in row for channel in pixel)
     assert core_energy > 0.0
     assert glow_energy > 0.0
+
+    target = FloatImage.new(640, 520, 0.0)
+    shared_core, _ = draw_label_layers((640, 520), placements, text_config, core=target)
+    assert shared_core is target
+    assert target.pixels == core.pixels
@@ -139,6 +139,10 @@ def test_generate_star_chart(tmp_path: Path):
     assert result.image.width == config.resolution.width
     assert result.image.height == config.resolution.height
     assert set(result.layers.keys()) >= {"stars", "ui_core", "ui_glow", "final_linear"}
+    # The layer is a snapshot; editing it must not touch the final image.
+    assert result.layers["final_linear"].pixels == result.image.pixels
+    result.layers["final_linear"].multiply(0.0)
+    assert result.layers["final_linear"].pixels != result.image.pixels
 
     total_light = sum(channel for row in result.image.pixels for pixel in row for channel in pixel)
     assert total_light > 0.0
@@ -238,3 +242,19 @@ def test_supersampling_consistency():
     supersampled_label_extent = _label_extent(supersampled_result.layers["ui_core"])
     assert base_label_extent == supersampled_label_extent
 
+
+def test_generate_star_chart_reports_progress_stages():
+    config = SceneConfig.from_dict(
+        {
+            "seed": 5,
+            "resolution": {"width": 32, "height": 32, "ssaa": 1},
+            "rings": [{"r": 0.3, "width": 0.01, "color": "#4384CE"}],
+            "stars": {"bulge": {"count": 10}, "bg": {"count": 5}},
+            "hud": {"enabled": False},
+        }
+    )
+
+    stages: list[str] = []
+    generate_star_chart(config, progress=stages.append)
+
+    assert stages == ["scene", "stars", "overlays", "post"]
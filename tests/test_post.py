@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import random
+
+from star_chart_generator.image import FloatImage
+from star_chart_generator.post import tone_map_aces
+
+
+def test_tone_map_downsample_matches_separate_passes():
+    rng = random.Random(3)
+    image = FloatImage.new(7, 5, 0.0)
+    for row in image.pixels:
+        for pixel in row:
+            pixel[:] = [rng.uniform(-0.2, 4.0) for _ in range(3)]
+
+    expected = tone_map_aces(image, gamma=2.2).downsample(2)
+    expected.clamp(0.0, 1.0)
+    fused = tone_map_aces(image, gamma=2.2, downsample=2)
+
+    assert (fused.width, fused.height) == (3, 2)
+    assert fused.pixels == expected.pixels
@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 import random
 
+import pytest
+
 from star_chart_generator.camera import create_projection
 from star_chart_generator.config import (
     BackgroundDistribution,
@@ -11,7 +13,12 @@ from star_chart_generator.config import (
     Resolution,
     StarConfig,
 )
-from star_chart_generator.sampling import generate_star_field, render_star_field
+from star_chart_generator.sampling import (
+    generate_star_arrays,
+    generate_star_field,
+    render_star_arrays,
+    render_star_field,
+)
 
 
 def _average(values: list[float]) -> float:
@@ -42,3 +49,86 @@ def test_star_field_distribution():
     halo_radii = [math.hypot(star.x - cx, star.y - cy) for star in stars[config.bulge.count :]]
 
     assert _average(core_radii) < _average(halo_radii)
+
+
+# Stars from the original per-``Star`` sampling loop for ``random.Random(5)``,
+# recorded before the field moved to parallel lists. Indexed by falloff alpha,
+# which selects between the two bulge radius samplers.
+_PINNED_STARS = {
+    1.0: [
+        (
+            44.712597954793914, 46.904905325610166, 1.7202341948630113, 2.2334667400289967,
+            (0.9760336826957697, 0.9228909791081288, 0.818689599524519),
+        ),
+        (
+            48.06281996635839, 47.98859364470983, 1.3584675374860828, 2.123199597343529,
+            (1.0, 1.0, 1.0),
+        ),
+        (
+            48.24852817570889, 47.93897449569291, 1.361383493423446, 1.964343513154757,
+            (1.0, 1.0, 1.0),
+        ),
+        (
+            73.27887694974953, 45.42032822490284, 1.160842271255065, 0.8477215435589421,
+            (0.8368491641495406, 0.6485219253365945, 0.3439107714944007),
+        ),
+        (
+            72.49467401268444, 50.76756563770868, 0.5946298663213437, 0.9164130840707834,
+            (0.8385597778307149, 0.6499588408287809, 0.34329495056917797),
+        ),
+    ],
+    1.8: [
+        (
+            46.211510946425136, 47.40422108070704, 1.7355709440703166, 2.2453930092318446,
+            (0.9950528716234325, 0.9840831521797394, 0.9625738983685764),
+        ),
+        (
+            48.02914960185605, 47.99470724461328, 1.3586174093101802, 2.12334013840187,
+            (1.0, 1.0, 1.0),
+        ),
+        (
+            48.11385251935748, 47.97204378380598, 1.362195578371135, 1.9650464848946818,
+            (1.0, 1.0, 1.0),
+        ),
+        (
+            73.27887694974953, 45.42032822490284, 1.160842271255065, 0.8477215435589421,
+            (0.8368491641495406, 0.6485219253365945, 0.3439107714944007),
+        ),
+        (
+            72.49467401268444, 50.76756563770868, 0.5946298663213437, 0.9164130840707834,
+            (0.8385597778307149, 0.6499588408287809, 0.34329495056917797),
+        ),
+    ],
+}
+
+
+def test_star_field_matches_pinned_samples():
+    resolution = Resolution(width=96, height=96, ssaa=1)
+    projection = create_projection(resolution, Camera(pitch_deg=70, fov_deg=35, z_far=6.0), [])
+
+    for alpha, expected in _PINNED_STARS.items():
+        config = StarConfig(
+            bulge=BulgeDistribution(sigma=0.2, falloff_alpha=alpha, count=3, size_px=(0.8, 2.0)),
+            background=BackgroundDistribution(count=2, size_px=(0.5, 1.2)),
+        )
+        stars = generate_star_field(config, projection, random.Random(5), ssaa=1)
+
+        assert len(stars) == len(expected)
+        for star, (x, y, radius, intensity, color) in zip(stars, expected):
+            assert (star.x, star.y, star.radius, star.intensity) == pytest.approx(
+                (x, y, radius, intensity), rel=1e-12
+            )
+            assert tuple(star.color) == pytest.approx(color, rel=1e-12)
+
+
+def test_render_star_arrays_matches_render_star_field():
+    resolution = Resolution(width=96, height=96, ssaa=1)
+    projection = create_projection(resolution, Camera(pitch_deg=70, fov_deg=35, z_far=6.0), [])
+    config = StarConfig(
+        bulge=BulgeDistribution(sigma=0.2, falloff_alpha=1.0, count=40, size_px=(0.8, 2.0)),
+        background=BackgroundDistribution(count=30, size_px=(0.5, 1.2)),
+    )
+
+    arrays = generate_star_arrays(config, projection, random.Random(5), ssaa=1)
+
+    assert render_star_arrays(arrays, projection) == render_star_field(arrays.to_stars(), projection)
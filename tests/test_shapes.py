@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from star_chart_generator.camera import create_projection
+from star_chart_generator.config import Camera, Resolution
+from star_chart_generator.shapes import _ring_outline
+
+
+def test_ring_outline_is_reused_for_equal_projections():
+    def projection():
+        return create_projection(
+            Resolution(width=200, height=160, ssaa=1), Camera(pitch_deg=70, fov_deg=35, z_far=6.0), []
+        )
+
+    points = _ring_outline(projection(), 0.4, 240)
+
+    assert len(points) == 240
+    assert _ring_outline(projection(), 0.4, 240) is points
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        points[0].x = 0.0